@@ -58,13 +58,12 @@ def demo_jet_simulation():
             forces = state.forces
             
             if forces:
-                drag_mag = np.linalg.norm(forces.get('drag', [0, 0, 0]))
-                lift_mag = np.linalg.norm(forces.get('lift', [0, 0, 0]))
-                coeffs = forces.get('coefficients', {})
+                drag_mag = np.linalg.norm(forces.drag)
+                lift_mag = np.linalg.norm(forces.lift)
                 
                 print(f"Step {steps:3d}: t={state.time:.2f}s, Speed={speed:.1f}m/s, "
                       f"Drag={drag_mag:.1f}N, Lift={lift_mag:.1f}N, "
-                      f"Cd={coeffs.get('cd', 0):.3f}, Cl={coeffs.get('cl', 0):.3f}")
+                      f"Cd={forces.cd:.3f}, Cl={forces.cl:.3f}")
     
     # Get final analysis
     analysis = sim.get_analysis_data()
@@ -49,6 +49,9 @@ setup(
             "flake8>=3.9",
             "mypy>=0.910",
         ],
+        "jit": [
+            "numba>=0.56",
+        ],
     },
     entry_points={
         "console_scripts": [
@@ -9,6 +9,34 @@ from typing import Dict, List, Tuple, Optional, Union
 from dataclasses import dataclass
 import struct
 import re
+import functools
+
+from ..jit import njit, prange, NUMBA_AVAILABLE
+
+# Vertex precision; geometry only feeds bulk aerodynamic estimates, so single
+# precision halves the memory traffic of the face scans
+VERTEX_DTYPE = np.float32
+
+# OBJ statements read by load_obj, in the order of their codes in _obj_statements
+_OBJ_KEYWORDS = ('v', 'vn', 'vt', 'f')
+
+@njit(parallel=True, fastmath=True, cache=True)
+def face_aggregates(vertices, faces):
+    """Surface area and signed volume summed over the triangles of a mesh"""
+    area = 0.0
+    volume = 0.0
+    for f in prange(faces.shape[0]):
+        a = vertices[faces[f, 0]]
+        b = vertices[faces[f, 1]]
+        c = vertices[faces[f, 2]]
+        e1x, e1y, e1z = b[0] - a[0], b[1] - a[1], b[2] - a[2]
+        e2x, e2y, e2z = c[0] - a[0], c[1] - a[1], c[2] - a[2]
+        nx = e1y * e2z - e1z * e2y
+        ny = e1z * e2x - e1x * e2z
+        nz = e1x * e2y - e1y * e2x
+        area += np.sqrt(nx * nx + ny * ny + nz * nz)
+        volume += a[0] * nx + a[1] * ny + a[2] * nz
+    return 0.5 * area, volume / 6.0
 
 @dataclass
 class Mesh:
@@ -19,11 +47,57 @@ class Mesh:
     texcoords: Optional[np.ndarray] = None  # Nx2 array of texture coordinates
     name: str = "Unnamed"
     
+    def __post_init__(self):
+        # Contiguous, fixed-dtype arrays for the vectorized face computations
+        self.vertices = np.ascontiguousarray(self.vertices, dtype=VERTEX_DTYPE)
+        self.faces = np.ascontiguousarray(self.faces, dtype=np.int32)
+    
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if name in ('vertices', 'faces'):
+            self.invalidate()
+    
+    def invalidate(self):
+        """Drop the cached aggregates; call after editing vertices or faces in place"""
+        self._bbox = None
+        self._surface_area = None
+        self._volume = None
+        self._frontal_area = None  # (direction, area)
+    
+    def _compute_all(self):
+        """Compute surface area and volume in one pass over the faces"""
+        if len(self.faces) == 0:
+            self._surface_area = 0.0
+            dimensions = self.get_dimensions()
+            self._volume = np.prod(dimensions, dtype=np.float64)  # Bounding box volume
+            return
+        
+        if NUMBA_AVAILABLE:
+            area, volume = face_aggregates(self.vertices, self.faces)
+            self._surface_area = area
+            self._volume = abs(volume)
+            return
+        
+        # Face normals (twice the triangle areas) serve both aggregates; the
+        # signed tetrahedron volumes are v0 . n / 6
+        v0, v1, v2 = self._face_vertices()
+        normals = np.cross(v1 - v0, v2 - v0)
+        self._surface_area = 0.5 * np.linalg.norm(normals, axis=1).sum(dtype=np.float64)
+        self._volume = abs(np.einsum('ij,ij->i', v0, normals).sum(dtype=np.float64) / 6.0)
+    
+    def _face_vertices(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Corner positions of every face, each an Mx3 array"""
+        faces = self.faces
+        return self.vertices[faces[:, 0]], self.vertices[faces[:, 1]], self.vertices[faces[:, 2]]
+    
     def get_bounds(self) -> Tuple[np.ndarray, np.ndarray]:
         """Get bounding box of the mesh"""
-        if len(self.vertices) == 0:
-            return np.zeros(3), np.zeros(3)
-        return np.min(self.vertices, axis=0), np.max(self.vertices, axis=0)
+        if self._bbox is None:
+            if len(self.vertices) == 0:
+                self._bbox = np.zeros(3), np.zeros(3)
+            else:
+                self._bbox = np.min(self.vertices, axis=0), np.max(self.vertices, axis=0)
+        return self._bbox
     
     def get_dimensions(self) -> np.ndarray:
         """Get dimensions (length, width, height) of the mesh"""
@@ -36,27 +110,34 @@ class Mesh:
         return (min_bounds + max_bounds) / 2
     
     def get_volume(self) -> float:
-        """Calculate approximate volume using bounding box"""
-        dimensions = self.get_dimensions()
-        return np.prod(dimensions)
+        """Calculate enclosed volume from the signed tetrahedra of the faces
+        
+        Falls back to the bounding box volume for a mesh without faces.
+        """
+        if self._volume is None:
+            self._compute_all()
+        return self._volume
     
     def get_surface_area(self) -> float:
         """Calculate approximate surface area"""
-        if len(self.faces) == 0:
-            return 0.0
-        
-        area = 0.0
-        for face in self.faces:
-            if len(face) >= 3:
-                # Triangle area using cross product
-                v1 = self.vertices[face[1]] - self.vertices[face[0]]
-                v2 = self.vertices[face[2]] - self.vertices[face[0]]
-                area += 0.5 * np.linalg.norm(np.cross(v1, v2))
-        
-        return area
+        if self._surface_area is None:
+            self._compute_all()
+        return self._surface_area
     
     def get_frontal_area(self, direction: np.ndarray = np.array([1, 0, 0])) -> float:
         """Calculate frontal area in given direction"""
+        key = tuple(direction)
+        if self._frontal_area is not None and self._frontal_area[0] == key:
+            return self._frontal_area[1]
+        
+        axis = np.flatnonzero(direction)
+        if len(axis) == 1:
+            # Axis-aligned view: the projection is the bounding box of the other two axes
+            width, height = np.delete(self.get_dimensions(), axis[0])
+            area = np.float64(height) * width
+            self._frontal_area = (key, area)
+            return area
+        
         # Project vertices onto plane perpendicular to direction
         direction = direction / np.linalg.norm(direction)
         
@@ -78,7 +159,9 @@ class Mesh:
         min_proj = np.min(projected, axis=0)
         max_proj = np.max(projected, axis=0)
         
-        return (max_proj[0] - min_proj[0]) * (max_proj[1] - min_proj[1])
+        area = (max_proj[0] - min_proj[0]) * (max_proj[1] - min_proj[1])
+        self._frontal_area = (key, area)
+        return area
 
 class MeshLoader:
     """Loader for various 3D mesh file formats"""
@@ -103,51 +186,129 @@ class MeshLoader:
         else:
             raise ValueError(f"Unsupported file format: {ext}")
     
+    @staticmethod
+    def _spans(starts: np.ndarray, stops: np.ndarray) -> np.ndarray:
+        """Concatenated index ranges starts[i]..stops[i]"""
+        lengths = stops - starts
+        shift = np.repeat(starts - (np.cumsum(lengths) - lengths), lengths)
+        return shift + np.arange(lengths.sum())
+    
+    @staticmethod
+    def _obj_statements(data: bytes) -> Dict[str, Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        """Parse the v, vn, vt and f statements of an OBJ file in bulk
+        
+        Works on the whole file as a byte array: comments and the texture and
+        normal parts of face corners are blanked, every token is located from
+        the whitespace mask, and each keyword's values are gathered and
+        converted with a single np.fromstring call. Maps each keyword to its
+        flat token array and each statement's token count and offset.
+        """
+        chars = np.frombuffer(data + b' ', dtype=np.uint8).copy()
+        breaks = np.flatnonzero(chars == ord('\n'))
+        line_ends = np.append(breaks, len(chars))
+        
+        # Drop comments, up to the end of their line
+        hashes = np.flatnonzero(chars == ord('#'))
+        if len(hashes):
+            chars[MeshLoader._spans(hashes, line_ends[np.searchsorted(line_ends, hashes)])] = ord(' ')
+        space = (chars == ord(' ')) | ((chars >= ord('\t')) & (chars <= ord('\r')))
+        
+        # Reduce face corners v/vt/vn to v
+        slashes = np.flatnonzero(chars == ord('/'))
+        if len(slashes):
+            blanks = np.flatnonzero(space)
+            tail = MeshLoader._spans(slashes, blanks[np.searchsorted(blanks, slashes)])
+            chars[tail] = ord(' ')
+            space[tail] = True
+        
+        # Tokens, the line each starts on, and which tokens open their line
+        starts = ~space
+        starts[1:] &= space[:-1]
+        ends = ~space
+        ends[:-1] &= space[1:]
+        start_pos = np.flatnonzero(starts)
+        end_pos = np.flatnonzero(ends)
+        line = np.searchsorted(breaks, start_pos)
+        first = np.ones(len(line), dtype=bool)
+        first[1:] = line[1:] != line[:-1]
+        
+        # Statement keyword of every line, -1 for lines this loader ignores
+        head = start_pos[first]
+        head_length = end_pos[first] - head + 1
+        lead = chars[head]
+        follow = chars[head + 1]
+        code = np.full(len(head), -1)
+        code[(head_length == 1) & (lead == ord('v'))] = 0
+        code[(head_length == 2) & (lead == ord('v')) & (follow == ord('n'))] = 1
+        code[(head_length == 2) & (lead == ord('v')) & (follow == ord('t'))] = 2
+        code[(head_length == 1) & (lead == ord('f'))] = 3
+        line_code = np.full(len(line_ends), -1)
+        line_code[line[first]] = code
+        value_code = np.where(first, -1, line_code[line])
+        
+        statements = {}
+        for k, keyword in enumerate(_OBJ_KEYWORDS):
+            rows = np.flatnonzero(line_code == k)
+            dtype = np.int64 if keyword == 'f' else np.float64
+            selected = value_code == k
+            counts = np.bincount(line[selected], minlength=len(line_ends))[rows]
+            
+            # Each value with the whitespace character that ends it
+            text = chars[MeshLoader._spans(start_pos[selected], end_pos[selected] + 2)].tobytes()
+            tokens = np.fromstring(text, dtype=dtype, sep=' ') if text else np.empty(0, dtype)
+            if len(tokens) != counts.sum():
+                raise ValueError(f"Malformed OBJ {keyword} statement")
+            statements[keyword] = tokens, counts, np.cumsum(counts) - counts
+        return statements
+    
+    @staticmethod
+    def _obj_vectors(rows: Tuple[np.ndarray, np.ndarray, np.ndarray], width: int,
+                     required: int) -> Optional[np.ndarray]:
+        """First width values of each statement as an (n, width) array
+        
+        Only the first required values must be present; missing optional
+        components (the v and w of 'vt u [v [w]]', for instance) are zero.
+        """
+        tokens, counts, offsets = rows
+        if not len(counts):
+            return None
+        if counts.min() < required:
+            raise ValueError("Malformed OBJ statement")
+        columns = np.arange(width)
+        present = columns < counts[:, None]
+        values = tokens[np.where(present, offsets[:, None] + columns, 0)]
+        return np.where(present, values, 0.0)
+    
     @staticmethod
     def load_obj(filepath: str) -> Mesh:
         """Load Wavefront OBJ file"""
-        vertices = []
-        faces = []
-        normals = []
-        texcoords = []
+        with open(filepath, 'rb') as file:
+            data = file.read()
         
-        with open(filepath, 'r') as file:
-            for line in file:
-                line = line.strip()
-                if not line or line.startswith('#'):
-                    continue
-                
-                parts = line.split()
-                if not parts:
-                    continue
-                
-                if parts[0] == 'v':  # Vertex
-                    vertices.append([float(x) for x in parts[1:4]])
-                elif parts[0] == 'vn':  # Vertex normal
-                    normals.append([float(x) for x in parts[1:4]])
-                elif parts[0] == 'vt':  # Texture coordinate
-                    texcoords.append([float(x) for x in parts[1:3]])
-                elif parts[0] == 'f':  # Face
-                    face_vertices = []
-                    for vertex_data in parts[1:]:
-                        # Handle different face formats: v, v/vt, v/vt/vn, v//vn
-                        vertex_indices = vertex_data.split('/')
-                        vertex_idx = int(vertex_indices[0]) - 1  # OBJ uses 1-based indexing
-                        face_vertices.append(vertex_idx)
-                    
-                    # Convert to triangles if necessary
-                    if len(face_vertices) == 3:
-                        faces.append(face_vertices)
-                    elif len(face_vertices) == 4:
-                        # Split quad into two triangles
-                        faces.append([face_vertices[0], face_vertices[1], face_vertices[2]])
-                        faces.append([face_vertices[0], face_vertices[2], face_vertices[3]])
+        statements = MeshLoader._obj_statements(data)
+        vertices = MeshLoader._obj_vectors(statements['v'], 3, 3)
+        normals = MeshLoader._obj_vectors(statements['vn'], 3, 1)
+        texcoords = MeshLoader._obj_vectors(statements['vt'], 2, 1)
+        
+        faces = np.empty((0, 3), dtype=int)
+        indices, counts, offsets = statements['f']
+        if len(counts):
+            indices = indices - 1  # OBJ uses 1-based indexing
+            
+            # Triangles are kept and quads split into two triangles, (0, 1, 2)
+            # and (0, 2, 3); degenerate faces and larger polygons are skipped
+            per_face = np.where(counts == 3, 1, 0) + np.where(counts == 4, 2, 0)
+            face_index = np.repeat(np.arange(len(counts)), per_face)
+            first = np.cumsum(per_face) - per_face
+            half = np.arange(len(face_index)) - first[face_index]
+            corners = np.array([[0, 1, 2], [0, 2, 3]])[half] + offsets[face_index, None]
+            faces = indices[corners]
         
         mesh = Mesh(
-            vertices=np.array(vertices) if vertices else np.empty((0, 3)),
-            faces=np.array(faces) if faces else np.empty((0, 3), dtype=int),
-            normals=np.array(normals) if normals else None,
-            texcoords=np.array(texcoords) if texcoords else None,
+            vertices=vertices if vertices is not None else np.empty((0, 3)),
+            faces=faces,
+            normals=normals,
+            texcoords=texcoords,
             name=os.path.basename(filepath)
         )
         
@@ -164,10 +325,10 @@ class MeshLoader:
                 file.seek(0)
                 try:
                     content = file.read().decode('utf-8')
-                    if 'facet normal' in content:
-                        return MeshLoader._load_stl_ascii(filepath)
-                except:
-                    pass
+                except UnicodeDecodeError:
+                    content = ''  # Binary data after a 'solid' header
+                if 'facet normal' in content:
+                    return MeshLoader._load_stl_ascii(filepath)
             
             # Binary STL
             return MeshLoader._load_stl_binary(filepath)
@@ -297,54 +458,66 @@ class MeshLoader:
     
     @staticmethod
     def create_primitive_mesh(primitive_type: str, **kwargs) -> Mesh:
-        """Create primitive mesh shapes"""
+        """Create primitive mesh shapes
+        
+        Every call returns a new Mesh, but its vertex and face arrays are
+        cached per argument set and shared, so they are read-only; assign
+        new arrays rather than editing them in place.
+        """
+        vertices, faces, name = MeshLoader._primitive_arrays(primitive_type, **kwargs)
+        return Mesh(vertices=vertices, faces=faces, name=name)
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=16)
+    def _primitive_arrays(primitive_type: str, **kwargs) -> Tuple[np.ndarray, np.ndarray, str]:
+        """Read-only vertex and face arrays and the name of a primitive mesh"""
         if primitive_type == 'sphere':
-            return MeshLoader._create_sphere(**kwargs)
+            mesh = MeshLoader._create_sphere(**kwargs)
         elif primitive_type == 'cube':
-            return MeshLoader._create_cube(**kwargs)
+            mesh = MeshLoader._create_cube(**kwargs)
         elif primitive_type == 'cylinder':
-            return MeshLoader._create_cylinder(**kwargs)
+            mesh = MeshLoader._create_cylinder(**kwargs)
         elif primitive_type == 'cone':
-            return MeshLoader._create_cone(**kwargs)
+            mesh = MeshLoader._create_cone(**kwargs)
         else:
             raise ValueError(f"Unknown primitive type: {primitive_type}")
+        
+        mesh.vertices.setflags(write=False)
+        mesh.faces.setflags(write=False)
+        return mesh.vertices, mesh.faces, mesh.name
     
     @staticmethod
     def _create_sphere(radius: float = 1.0, subdivisions: int = 20) -> Mesh:
         """Create sphere mesh"""
-        vertices = []
-        faces = []
+        segments = subdivisions * 2
         
         # Generate vertices using spherical coordinates
-        for i in range(subdivisions + 1):
-            theta = np.pi * i / subdivisions  # 0 to pi
-            for j in range(subdivisions * 2):
-                phi = 2 * np.pi * j / (subdivisions * 2)  # 0 to 2pi
-                
-                x = radius * np.sin(theta) * np.cos(phi)
-                y = radius * np.cos(theta)
-                z = radius * np.sin(theta) * np.sin(phi)
-                
-                vertices.append([x, y, z])
-        
-        # Generate faces
-        for i in range(subdivisions):
-            for j in range(subdivisions * 2):
-                # Current quad vertices
-                v1 = i * (subdivisions * 2) + j
-                v2 = i * (subdivisions * 2) + (j + 1) % (subdivisions * 2)
-                v3 = (i + 1) * (subdivisions * 2) + j
-                v4 = (i + 1) * (subdivisions * 2) + (j + 1) % (subdivisions * 2)
-                
-                # Skip degenerate triangles at poles
-                if i > 0:
-                    faces.append([v1, v2, v3])
-                if i < subdivisions - 1:
-                    faces.append([v2, v4, v3])
+        theta = (np.pi * np.arange(subdivisions + 1) / subdivisions)[:, None]  # 0 to pi
+        phi = (2 * np.pi * np.arange(segments) / segments)[None, :]  # 0 to 2pi
+        vertices = np.stack([
+            radius * np.sin(theta) * np.cos(phi),
+            np.broadcast_to(radius * np.cos(theta), (subdivisions + 1, segments)),
+            radius * np.sin(theta) * np.sin(phi)
+        ], axis=-1).reshape(-1, 3)
+        
+        # Generate faces from the quad corners of every grid cell
+        rows = np.arange(subdivisions)[:, None] * segments
+        j = np.arange(segments)[None, :]
+        v1 = rows + j
+        v2 = rows + (j + 1) % segments
+        v3 = v1 + segments
+        v4 = v2 + segments
+        triangles = np.stack([np.stack([v1, v2, v3], axis=-1),
+                              np.stack([v2, v4, v3], axis=-1)], axis=2)
+        
+        # Skip degenerate triangles at poles
+        keep = np.ones((subdivisions, segments, 2), dtype=bool)
+        keep[0, :, 0] = False
+        keep[-1, :, 1] = False
         
         return Mesh(
-            vertices=np.array(vertices),
-            faces=np.array(faces),
+            vertices=vertices,
+            faces=triangles[keep],
             name="Sphere"
         )
     
@@ -368,88 +541,57 @@ class MeshLoader:
         
         return Mesh(vertices=vertices, faces=faces, name="Cube")
     
+    @staticmethod
+    def _ring(radius: float, y: float, subdivisions: int) -> np.ndarray:
+        """Vertices of a horizontal circle at height y"""
+        angle = 2 * np.pi * np.arange(subdivisions) / subdivisions
+        return np.stack([radius * np.cos(angle), np.full(subdivisions, y), radius * np.sin(angle)], axis=-1)
+    
     @staticmethod
     def _create_cylinder(radius: float = 1.0, height: float = 2.0, subdivisions: int = 16) -> Mesh:
         """Create cylinder mesh"""
-        vertices = []
-        faces = []
+        # Bottom center, top center, then the bottom and top circles
+        vertices = np.concatenate([
+            [[0, -height/2, 0], [0, height/2, 0]],
+            MeshLoader._ring(radius, -height/2, subdivisions),
+            MeshLoader._ring(radius, height/2, subdivisions)
+        ])
         
-        # Bottom center
-        vertices.append([0, -height/2, 0])
-        # Top center
-        vertices.append([0, height/2, 0])
-        
-        # Bottom circle vertices
-        for i in range(subdivisions):
-            angle = 2 * np.pi * i / subdivisions
-            x = radius * np.cos(angle)
-            z = radius * np.sin(angle)
-            vertices.append([x, -height/2, z])
-        
-        # Top circle vertices
-        for i in range(subdivisions):
-            angle = 2 * np.pi * i / subdivisions
-            x = radius * np.cos(angle)
-            z = radius * np.sin(angle)
-            vertices.append([x, height/2, z])
-        
-        # Bottom faces
-        for i in range(subdivisions):
-            next_i = (i + 1) % subdivisions
-            faces.append([0, 2 + next_i, 2 + i])
-        
-        # Top faces
-        for i in range(subdivisions):
-            next_i = (i + 1) % subdivisions
-            faces.append([1, 2 + subdivisions + i, 2 + subdivisions + next_i])
-        
-        # Side faces
-        for i in range(subdivisions):
-            next_i = (i + 1) % subdivisions
-            v1 = 2 + i
-            v2 = 2 + next_i
-            v3 = 2 + subdivisions + i
-            v4 = 2 + subdivisions + next_i
-            
-            faces.append([v1, v2, v3])
-            faces.append([v2, v4, v3])
+        i = np.arange(subdivisions)
+        next_i = (i + 1) % subdivisions
+        bottom = np.stack([np.zeros_like(i), 2 + next_i, 2 + i], axis=-1)
+        top = np.stack([np.ones_like(i), 2 + subdivisions + i, 2 + subdivisions + next_i], axis=-1)
+        
+        # Side faces, two triangles per quad
+        v1 = 2 + i
+        v2 = 2 + next_i
+        v3 = 2 + subdivisions + i
+        v4 = 2 + subdivisions + next_i
+        sides = np.stack([np.stack([v1, v2, v3], axis=-1),
+                          np.stack([v2, v4, v3], axis=-1)], axis=1).reshape(-1, 3)
         
         return Mesh(
-            vertices=np.array(vertices),
-            faces=np.array(faces),
+            vertices=vertices,
+            faces=np.concatenate([bottom, top, sides]),
             name="Cylinder"
         )
     
     @staticmethod
     def _create_cone(radius: float = 1.0, height: float = 2.0, subdivisions: int = 16) -> Mesh:
         """Create cone mesh"""
-        vertices = []
-        faces = []
-        
-        # Apex
-        vertices.append([0, height/2, 0])
-        # Base center
-        vertices.append([0, -height/2, 0])
-        
-        # Base circle vertices
-        for i in range(subdivisions):
-            angle = 2 * np.pi * i / subdivisions
-            x = radius * np.cos(angle)
-            z = radius * np.sin(angle)
-            vertices.append([x, -height/2, z])
-        
-        # Base faces
-        for i in range(subdivisions):
-            next_i = (i + 1) % subdivisions
-            faces.append([1, 2 + next_i, 2 + i])
+        # Apex, base center, then the base circle
+        vertices = np.concatenate([
+            [[0, height/2, 0], [0, -height/2, 0]],
+            MeshLoader._ring(radius, -height/2, subdivisions)
+        ])
         
-        # Side faces
-        for i in range(subdivisions):
-            next_i = (i + 1) % subdivisions
-            faces.append([0, 2 + i, 2 + next_i])
+        i = np.arange(subdivisions)
+        next_i = (i + 1) % subdivisions
+        base = np.stack([np.ones_like(i), 2 + next_i, 2 + i], axis=-1)
+        sides = np.stack([np.zeros_like(i), 2 + i, 2 + next_i], axis=-1)
         
         return Mesh(
-            vertices=np.array(vertices),
-            faces=np.array(faces),
+            vertices=vertices,
+            faces=np.concatenate([base, sides]),
             name="Cone"
-        )
\ No newline at end of file
+        )
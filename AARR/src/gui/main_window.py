@@ -426,7 +426,7 @@ class AerodynamicSimulationApp(QMainWindow):
         # Removed: self.data_plots.update_data(self.simulation_manager.results)
         
         # Check if we have simulation data
-        if not hasattr(self.simulation_manager.results, 'time_history') or not self.simulation_manager.results.time_history:
+        if self.simulation_manager.results.time_history.size == 0:
             return
             
         # Get current data
@@ -4,22 +4,81 @@ Visualization Widgets for Flow and Data Display
 
 import numpy as np
 import pyqtgraph as pg
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QComboBox, QCheckBox
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QComboBox, QCheckBox, QSpinBox
 from PySide6.QtCore import Qt
-from PySide6.QtGui import QColor
+from PySide6.QtGui import QColor, QOpenGLContext
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 import matplotlib.patches as patches
 
+from ..jit import njit, prange, NUMBA_AVAILABLE
+
 ##SAFE
 
+# Time series longer than this are peak-decimated before being handed to pyqtgraph
+MAX_PLOT_POINTS = 10000
+
+@njit(parallel=True, fastmath=True, cache=True)
+def peak_decimate(x, y, target):
+    """Reduce a series to the min and max of each of target buckets"""
+    size = x.size
+    out_x = np.empty(2 * target, dtype=x.dtype)
+    out_y = np.empty(2 * target, dtype=y.dtype)
+    for b in prange(target):
+        lo = b * size // target
+        hi = (b + 1) * size // target
+        mn = y[lo]
+        mx = mn
+        for k in range(lo + 1, hi):
+            v = y[k]
+            if v < mn:
+                mn = v
+            if v > mx:
+                mx = v
+        out_x[2 * b] = x[lo]
+        out_x[2 * b + 1] = x[hi - 1]
+        out_y[2 * b] = mn
+        out_y[2 * b + 1] = mx
+    return out_x, out_y
+
+# Compile at import so the first plot doesn't pay the JIT latency; the plot
+# buffers are float32, so that is the specialization to build
+peak_decimate(np.zeros(4, np.float32), np.zeros(4, np.float32), 2)
+
+def _decimate(x, y):
+    """Peak-decimate a time series if it is too long to plot in full"""
+    if len(x) <= MAX_PLOT_POINTS:
+        return x, y
+    target = MAX_PLOT_POINTS // 2
+    if NUMBA_AVAILABLE:
+        return peak_decimate(np.ascontiguousarray(x), np.ascontiguousarray(y), target)
+        
+    # Interpreted, the kernel's per-sample loop is far slower than ufunc reductions
+    lo = np.arange(target) * len(x) // target
+    hi = np.append(lo[1:], len(x))
+    out_x = np.column_stack((x[lo], x[hi - 1])).ravel()
+    out_y = np.column_stack((np.minimum.reduceat(y, lo), np.maximum.reduceat(y, lo))).ravel()
+    return out_x, out_y
+
+def _opengl_available():
+    """Check whether an OpenGL context can be created on this display"""
+    return QOpenGLContext().create()
+
 class FlowVisualizationWidget(QWidget):
     """Widget for visualizing flow fields and streamlines"""
     
     def __init__(self):
         super().__init__()
         self.current_data = None
+        self._dyn_artists = []  # Artists owned by the current visualization
+        self._cbar = None
+        self._source_flow_field = None
+        self._prepared_flow_field = None
+        self._quiver_cache = {}
+        self._obj_patch = None
+        self._disp_skip = 5  # Render every Nth update
+        self._tick = 0
         self.init_ui()
         
     def init_ui(self):
@@ -50,6 +109,13 @@ class FlowVisualizationWidget(QWidget):
         self.show_vectors_check.stateChanged.connect(self.update_visualization)
         control_layout.addWidget(self.show_vectors_check)
         
+        control_layout.addWidget(QLabel("Render Every:"))
+        self.disp_skip_spin = QSpinBox()
+        self.disp_skip_spin.setRange(1, 50)
+        self.disp_skip_spin.setValue(self._disp_skip)
+        self.disp_skip_spin.valueChanged.connect(self._set_disp_skip)
+        control_layout.addWidget(self.disp_skip_spin)
+        
         control_layout.addStretch()
         layout.addLayout(control_layout)
         
@@ -63,10 +129,58 @@ class FlowVisualizationWidget(QWidget):
         plt.style.use('dark_background')
         self.figure.patch.set_facecolor('#2d2d30')
         
+        # Axes are created once and reused; only the plotted artists change.
+        # The grid columns (plot, pad, colorbar, label margin) reproduce the
+        # default colorbar layout; the plot spans all of them when the current
+        # view has no colorbar.
+        self._grid = self.figure.add_gridspec(1, 4, width_ratios=[0.62, 0.039, 0.026, 0.09], wspace=0)
+        self._ax = self.figure.add_subplot(self._grid[0, :])
+        self._cax = self.figure.add_subplot(self._grid[0, 2])
+        self._cax.set_visible(False)
+        self._ax.set_aspect('equal')
+        self._ax.set_xlabel('X Position (m)', color='white')
+        self._ax.set_ylabel('Y Position (m)', color='white')
+        self._ax.tick_params(colors='white')
+        self._ax.set_facecolor('#1e1e1e')
+        
+    def _set_disp_skip(self, value):
+        """Set how many data updates pass between renders"""
+        self._disp_skip = value
+        
     def update_data(self, data):
         """Update with new simulation data"""
         self.current_data = data
-        self.update_visualization()
+        
+        # Decouple the render rate from the simulation update rate
+        tick = self._tick
+        self._tick += 1
+        if tick % self._disp_skip == 0:
+            self.update_visualization()
+        
+    def _prepare_flow_field(self, flow_field):
+        """Derive plot inputs once per flow field rather than once per redraw"""
+        # The display timer keeps handing us the same latest flow field
+        if flow_field is self._source_flow_field:
+            return self._prepared_flow_field
+            
+        prepared = self._coerce(flow_field)
+        if 'velocity_magnitude' not in prepared:
+            u, v = prepared['u'], prepared['v']
+            prepared['velocity_magnitude'] = np.sqrt(u*u + v*v, dtype=np.float32)
+            
+        self._source_flow_field = flow_field
+        self._prepared_flow_field = prepared
+        self._quiver_cache = {}
+        return prepared
+        
+    @staticmethod
+    def _coerce(flow_field):
+        """Copy a flow field with its float64 grids as contiguous float32"""
+        # contourf/streamplot/quiver are bandwidth bound and accept float32
+        # as-is, so this halves the bytes they move
+        return {key: (np.ascontiguousarray(value, dtype=np.float32)
+                      if isinstance(value, np.ndarray) and value.dtype == np.float64 else value)
+                for key, value in flow_field.items()}
         
     def update_visualization(self):
         """Update the visualization"""
@@ -76,33 +190,70 @@ class FlowVisualizationWidget(QWidget):
         flow_field = self.current_data['flow_field']
         if not flow_field:
             return
+        flow_field = self._prepare_flow_field(flow_field)
             
-        self.figure.clear()
-        ax = self.figure.add_subplot(111)
-        
+        ax = self._ax
         viz_type = self.viz_combo.currentText()
         
+        self._remove_dynamic_artists()
+        existing = set(ax.get_children())
+        mappable = None
+        
         if viz_type == "Streamlines":
             self._plot_streamlines(ax, flow_field)
         elif viz_type == "Velocity Field":
             self._plot_velocity_field(ax, flow_field)
         elif viz_type == "Pressure Field":
-            self._plot_pressure_field(ax, flow_field)
+            mappable = self._plot_pressure_field(ax, flow_field)
         elif viz_type == "Velocity Magnitude":
-            self._plot_velocity_magnitude(ax, flow_field)
+            mappable = self._plot_velocity_magnitude(ax, flow_field)
         elif viz_type == "Combined View":
-            self._plot_combined_view(ax, flow_field)
+            mappable = self._plot_combined_view(ax, flow_field)
             
-        if self.show_object_check.isChecked():
-            self._draw_object(ax)
-            
-        ax.set_aspect('equal')
-        ax.set_xlabel('X Position (m)', color='white')
-        ax.set_ylabel('Y Position (m)', color='white')
-        ax.tick_params(colors='white')
-        ax.set_facecolor('#1e1e1e')
+        # streamplot adds its arrows as loose patches, so collect everything
+        # the plot call attached rather than relying on return values
+        self._dyn_artists = [a for a in ax.get_children() if a not in existing]
         
-        self.canvas.draw()
+        self._draw_object(ax)
+        
+        if mappable is not None:
+            label = 'Pressure (Pa)' if viz_type == "Pressure Field" else 'Velocity Magnitude (m/s)'
+            self._update_colorbar(mappable, label)
+        else:
+            self._remove_colorbar()
+        
+        # Let Qt coalesce the Agg render into its next paint instead of
+        # blocking the caller
+        self.canvas.draw_idle()
+        
+    def _remove_dynamic_artists(self):
+        """Remove the artists drawn by the previous visualization"""
+        for artist in self._dyn_artists:
+            artist.remove()
+        self._dyn_artists = []
+        
+        # Let the next plot compute data limits as if on fresh axes
+        self._ax.ignore_existing_data_limits = True
+        
+    def _update_colorbar(self, mappable, label):
+        """Draw the colorbar into the persistent colorbar axes"""
+        if self._cbar is None:
+            self._ax.set_subplotspec(self._grid[0, 0])
+            self._cax.set_visible(True)
+            
+        # Contour levels are fixed when a Colorbar is built, so the colorbar
+        # itself is rebuilt; only its axes and the layout are reused
+        self._cax.clear()
+        self._cbar = self.figure.colorbar(mappable, cax=self._cax)
+        self._cbar.ax.tick_params(colors='white')
+        self._cbar.set_label(label, color='white')
+        
+    def _remove_colorbar(self):
+        """Hide the colorbar and give its space back to the axes"""
+        if self._cbar is not None:
+            self._cax.set_visible(False)
+            self._ax.set_subplotspec(self._grid[0, :])
+            self._cbar = None
         
     def _plot_streamlines(self, ax, flow_field):
         """Plot streamlines"""
@@ -124,10 +275,20 @@ class FlowVisualizationWidget(QWidget):
         X, Y = flow_field['x'], flow_field['y']
         U, V = flow_field['u'], flow_field['v']
         
-        # Subsample for cleaner visualization
+        # Subsample for cleaner visualization. quiver copies strided input,
+        # so make the contiguous copies once and keep them for view toggles
         skip = 5
-        ax.quiver(X[::skip, ::skip], Y[::skip, ::skip], 
-                 U[::skip, ::skip], V[::skip, ::skip],
+        key = (id(X), skip)
+        if self._quiver_cache.get('key') != key:
+            self._quiver_cache = {
+                'key': key,
+                'X': np.ascontiguousarray(X[::skip, ::skip]),
+                'Y': np.ascontiguousarray(Y[::skip, ::skip]),
+                'U': np.ascontiguousarray(U[::skip, ::skip]),
+                'V': np.ascontiguousarray(V[::skip, ::skip])
+            }
+        cache = self._quiver_cache
+        ax.quiver(cache['X'], cache['Y'], cache['U'], cache['V'],
                  scale=200, color='lime', alpha=0.7)
                  
         ax.set_title('Velocity Field', color='white', fontsize=14)
@@ -140,15 +301,11 @@ class FlowVisualizationWidget(QWidget):
         # Create contour plot
         contour = ax.contourf(X, Y, pressure, levels=20, cmap='RdYlBu_r', alpha=0.8)
         
-        # Add colorbar
-        cbar = self.figure.colorbar(contour, ax=ax)
-        cbar.set_label('Pressure (Pa)', color='white')
-        cbar.ax.tick_params(colors='white')
-        
         # Add contour lines
         ax.contour(X, Y, pressure, levels=10, colors='white', alpha=0.5, linewidths=0.5)
         
         ax.set_title('Pressure Field', color='white', fontsize=14)
+        return contour
         
     def _plot_velocity_magnitude(self, ax, flow_field):
         """Plot velocity magnitude"""
@@ -158,12 +315,8 @@ class FlowVisualizationWidget(QWidget):
         # Create filled contour plot
         contour = ax.contourf(X, Y, vel_mag, levels=20, cmap='plasma', alpha=0.8)
         
-        # Add colorbar
-        cbar = self.figure.colorbar(contour, ax=ax)
-        cbar.set_label('Velocity Magnitude (m/s)', color='white')
-        cbar.ax.tick_params(colors='white')
-        
         ax.set_title('Velocity Magnitude', color='white', fontsize=14)
+        return contour
         
     def _plot_combined_view(self, ax, flow_field):
         """Plot combined visualization"""
@@ -177,28 +330,41 @@ class FlowVisualizationWidget(QWidget):
         # Overlay: streamlines
         ax.streamplot(X, Y, U, V, color='white', density=1.5, linewidth=1, arrowsize=1)
         
-        # Colorbar
-        cbar = self.figure.colorbar(contour, ax=ax)
-        cbar.set_label('Velocity Magnitude (m/s)', color='white')
-        cbar.ax.tick_params(colors='white')
-        
         ax.set_title('Combined Flow Visualization', color='white', fontsize=14)
+        return contour
+        
+    def _get_object_patch(self):
+        """Return the object patch, creating it on first use"""
+        if self._obj_patch is None:
+            # Simple representation - can be enhanced based on object type
+            # For now, draw a simple ellipse representing the object
+            obj_width = 2.0  # This should come from geometry data
+            obj_height = 1.0
+            
+            # zorder keeps it above filled contours but under streamlines and
+            # vectors, as when it was re-added after each plot
+            self._obj_patch = patches.Ellipse((0, 0), obj_width, obj_height, 
+                                              facecolor='red', edgecolor='darkred', 
+                                              alpha=0.8, linewidth=2, zorder=1.5)
+        return self._obj_patch
         
     def _draw_object(self, ax):
-        """Draw the object in the flow field"""
-        # Simple representation - can be enhanced based on object type
-        # For now, draw a simple ellipse representing the object
-        obj_width = 2.0  # This should come from geometry data
-        obj_height = 1.0
-        
-        ellipse = patches.Ellipse((0, 0), obj_width, obj_height, 
-                                 facecolor='red', edgecolor='darkred', 
-                                 alpha=0.8, linewidth=2)
-        ax.add_patch(ellipse)
+        """Show or hide the object in the flow field"""
+        patch = self._get_object_patch()
+        if not self.show_object_check.isChecked():
+            if patch.axes is not None:
+                patch.remove()
+        elif patch.axes is not ax:
+            ax.add_patch(patch)
         
     def clear(self):
         """Clear the visualization"""
-        self.figure.clear()
+        self._tick = 0
+        self._remove_colorbar()
+        self._remove_dynamic_artists()
+        if self._obj_patch is not None and self._obj_patch.axes is not None:
+            self._obj_patch.remove()
+        self._ax.set_title('')
         self.canvas.draw()
 
 class DataPlotWidget(QWidget):
@@ -207,6 +373,10 @@ class DataPlotWidget(QWidget):
     def __init__(self):
         super().__init__()
         self.results = None
+        self._arrow_pool = []
+        self._curves = {}  # Persistent curves of the plot type being shown
+        self._shown_type = None
+        self._reset_buffers()
         self.init_ui()
         
     def init_ui(self):
@@ -237,6 +407,16 @@ class DataPlotWidget(QWidget):
         self.plot_widget = pg.PlotWidget()
         self.plot_widget.setBackground('#1e1e1e')
         
+        # Rasterize curves on the GPU where possible. Without a usable GL
+        # context (remote/offscreen sessions) keep the default QPainter path.
+        if _opengl_available():
+            self.plot_widget.useOpenGL(True)
+            
+        # Only draw the visible part of long histories, decimated to the
+        # screen resolution while keeping peaks
+        self.plot_widget.setClipToView(True)
+        self.plot_widget.setDownsampling(auto=True, mode='peak')
+        
         # Enhanced axis styling
         left_axis = self.plot_widget.getAxis('left')
         bottom_axis = self.plot_widget.getAxis('bottom')
@@ -255,34 +435,94 @@ class DataPlotWidget(QWidget):
         # Enable antialiasing for smoother lines
         self.plot_widget.setAntialiasing(True)
         
+        # Curve pens, built once and shared by every plot type
+        self._pen_red = pg.mkPen(color='red', width=2)
+        self._pen_lime = pg.mkPen(color='lime', width=2)
+        self._pen_cyan = pg.mkPen(color='cyan', width=2)
+        self._pen_white = pg.mkPen(color='white', width=3)
+        
         # Set default grid
         self.plot_widget.showGrid(x=True, y=True, alpha=0.3)
         
+        # Add legend with better styling; named curves register themselves
+        self.legend = self.plot_widget.addLegend()
+        self.legend.setLabelTextColor('white')
+        
         layout.addWidget(self.plot_widget)
         
     def update_data(self, results):
         """Update with new simulation results"""
+        # A different or rewound results object invalidates the mirrored rows
+        # and everything drawn from them
+        if results is not self.results or (results and len(results.time_history) < self._buf_n):
+            self._buf_n = 0
+            self._reset_plot()
         self.results = results
+        if results:
+            self._sync_buffers()
         self.update_plot()
         
+    def _reset_buffers(self, capacity=1024):
+        """Allocate empty plot-side mirrors of the result histories"""
+        # Display only, so float32 is plenty and halves what pyqtgraph has to
+        # move; the results keep full precision
+        self._buf_n = 0
+        self._buf_times = np.empty(capacity, dtype=np.float32)
+        self._buf_pos = np.empty((capacity, 3), dtype=np.float32)
+        self._buf_vel = np.empty((capacity, 3), dtype=np.float32)
+        self._buf_forces = np.empty((capacity, 4), dtype=np.float32)  # |drag|, |lift|, |total|, |side|
+        self._buf_coeffs = np.empty((capacity, 3), dtype=np.float32)  # cd, cl, reynolds
+        
+    def _sync_buffers(self):
+        """Copy only the rows recorded since the last update into the buffers"""
+        results = self.results
+        n = results.n
+        start = self._buf_n
+        if n <= start:
+            return
+            
+        capacity = len(self._buf_times)
+        if n > capacity:
+            while capacity < n:
+                capacity *= 2
+            self._buf_times = np.resize(self._buf_times, capacity)
+            self._buf_pos = np.resize(self._buf_pos, (capacity, 3))
+            self._buf_vel = np.resize(self._buf_vel, (capacity, 3))
+            self._buf_forces = np.resize(self._buf_forces, (capacity, 4))
+            self._buf_coeffs = np.resize(self._buf_coeffs, (capacity, 3))
+            
+        new = slice(start, n)
+        self._buf_times[new] = results.time_history[new]
+        self._buf_pos[new] = results.position_history[new]
+        self._buf_vel[new] = results.velocity_history[new]
+        
+        for column, forces in enumerate((results.drag_forces, results.lift_forces,
+                                         results.total_forces, results.side_forces)):
+            self._buf_forces[new, column] = forces.norms(start, n)
+        for column, values in enumerate((results.cd, results.cl, results.reynolds)):
+            self._buf_coeffs[new, column] = values[new]
+            
+        self._buf_n = n
+        
     def update_plot(self):
         """Update the plot"""
         if not self.results:
-            self.plot_widget.clear()
+            self._reset_plot()
             self.plot_widget.setTitle("No simulation data - Start simulation to see plots", color='white', size='12pt')
             return
             
         # Check if we have any data at all
-        if (not hasattr(self.results, 'time_history') or 
-            not self.results.time_history or 
-            len(self.results.time_history) == 0):
+        if self.results.time_history.size == 0:
             # Show empty plot message
-            self.plot_widget.clear()
+            self._reset_plot()
             self.plot_widget.setTitle("No data available - Start simulation to see plots", color='white', size='12pt')
             return
             
-        self.plot_widget.clear()
+        # Curves persist while the plot type stays the same and only get new data
         plot_type = self.plot_combo.currentText()
+        if plot_type != self._shown_type:
+            self._reset_plot()
+            self._shown_type = plot_type
         
         try:
             if plot_type == "Velocity vs Time":
@@ -308,347 +548,251 @@ class DataPlotWidget(QWidget):
             print(f"Error plotting {plot_type}: {e}")
             import traceback
             traceback.print_exc()
+            self._reset_plot()
             self.plot_widget.setTitle(f"Error plotting {plot_type}: {str(e)}", color='red', size='12pt')
             
+    def _reset_plot(self):
+        """Remove all curves so the next plot starts from an empty widget"""
+        self.plot_widget.clear()
+        self._curves = {}
+        self._shown_type = None
+        
+    def _curve(self, key, **opts):
+        """Return the persistent curve for key, creating it on first use"""
+        curve = self._curves.get(key)
+        if curve is None:
+            curve = self._curves[key] = self.plot_widget.plot(**opts)
+        return curve
+        
+    def _drop_curve(self, key):
+        """Remove the curve for key if it is shown"""
+        curve = self._curves.pop(key, None)
+        if curve is not None:
+            self.plot_widget.removeItem(curve)
+            
+    def _set_labels(self, left, bottom, title):
+        """Set axis labels and title, once per plot type"""
+        if self._curves:
+            return
+        self.plot_widget.setLabel('left', left, color='white', size='12pt')
+        self.plot_widget.setLabel('bottom', bottom, color='white', size='12pt')
+        self.plot_widget.setTitle(title, color='white', size='14pt')
+        
     def _plot_velocity_time(self):
         """Plot velocity components vs time"""
-        if not hasattr(self.results, 'velocity_history') or not self.results.velocity_history:
+        if self.results.velocity_history.size == 0:
             self.plot_widget.setTitle("No velocity data available", color='yellow', size='12pt')
             return
             
-        times = np.array(self.results.time_history)
-        velocities = np.array(self.results.velocity_history)
+        times = self._buf_times[:self._buf_n]
+        velocities = self._buf_vel[:self._buf_n]
         
-        if len(velocities) == 0 or len(times) == 0:
+        if len(velocities) == 0:
             self.plot_widget.setTitle("No velocity data available", color='yellow', size='12pt')
             return
+            
+        self._set_labels('Velocity (m/s)', 'Time (s)', 'Velocity vs Time')
         
-        # Ensure data consistency
-        min_len = min(len(times), len(velocities))
-        times = times[:min_len]
-        velocities = velocities[:min_len]
-        
-        # Clear any existing legend
-        self.plot_widget.clear()
-        
-        if velocities.ndim == 1:
-            # Handle 1D velocity data
-            self.plot_widget.plot(times, velocities, pen=pg.mkPen(color='white', width=3), name='Velocity')
-        else:
-            # Handle 3D velocity data
-            if velocities.shape[1] >= 3:
-                # Use brighter, thicker lines for better visibility
-                self.plot_widget.plot(times, velocities[:, 0], pen=pg.mkPen(color='red', width=2), name='Vx')
-                self.plot_widget.plot(times, velocities[:, 1], pen=pg.mkPen(color='lime', width=2), name='Vy')
-                self.plot_widget.plot(times, velocities[:, 2], pen=pg.mkPen(color='cyan', width=2), name='Vz')
-                
-                # Plot velocity magnitude with thicker white line
-                vel_mag = np.linalg.norm(velocities, axis=1)
-                self.plot_widget.plot(times, vel_mag, pen=pg.mkPen(color='white', width=3), name='|V|')
-        
-        self.plot_widget.setLabel('left', 'Velocity (m/s)', color='white', size='12pt')
-        self.plot_widget.setLabel('bottom', 'Time (s)', color='white', size='12pt')
-        self.plot_widget.setTitle('Velocity vs Time', color='white', size='14pt')
+        # Use brighter, thicker lines for better visibility
+        self._curve('vx', pen=self._pen_red, name='Vx').setData(*_decimate(times, velocities[:, 0]))
+        self._curve('vy', pen=self._pen_lime, name='Vy').setData(*_decimate(times, velocities[:, 1]))
+        self._curve('vz', pen=self._pen_cyan, name='Vz').setData(*_decimate(times, velocities[:, 2]))
         
-        # Add legend with better styling
-        legend = self.plot_widget.addLegend()
-        legend.setLabelTextColor('white')
+        # Plot velocity magnitude with thicker white line
+        vel_mag = np.linalg.norm(velocities, axis=1)
+        self._curve('vmag', pen=self._pen_white, name='|V|').setData(*_decimate(times, vel_mag))
         
     def _plot_forces_time(self):
         """Plot forces vs time"""
-        if not hasattr(self.results, 'force_history') or not self.results.force_history:
+        if not self.results.force_history:
             self.plot_widget.setTitle("No force data available", color='yellow', size='12pt')
             return
             
-        times = np.array(self.results.time_history)
+        times = self._buf_times[:self._buf_n]
         
         if len(times) == 0:
             self.plot_widget.setTitle("No time data available", color='yellow', size='12pt')
             return
             
-        drag_forces = []
-        lift_forces = []
-        total_forces = []
-        
-        for forces in self.results.force_history:
-            if isinstance(forces, dict):
-                drag_forces.append(np.linalg.norm(forces.get('drag', [0, 0, 0])))
-                lift_forces.append(np.linalg.norm(forces.get('lift', [0, 0, 0])))
-                total_forces.append(np.linalg.norm(forces.get('total', [0, 0, 0])))
-            else:
-                # Handle case where forces might be stored differently
-                drag_forces.append(0)
-                lift_forces.append(0)
-                total_forces.append(0)
-        
-        # Ensure data consistency
-        min_len = min(len(times), len(drag_forces))
-        times = times[:min_len]
-        drag_forces = np.array(drag_forces[:min_len])
-        lift_forces = np.array(lift_forces[:min_len])
-        total_forces = np.array(total_forces[:min_len])
-        
-        if min_len > 0:
-            # Use brighter colors and thicker lines
-            self.plot_widget.plot(times, drag_forces, pen=pg.mkPen(color='red', width=2), name='Drag')
-            self.plot_widget.plot(times, lift_forces, pen=pg.mkPen(color='lime', width=2), name='Lift')
-            self.plot_widget.plot(times, total_forces, pen=pg.mkPen(color='white', width=3), name='Total')
-            
-            # Add side force if available
-            side_forces = []
-            for forces in self.results.force_history[:min_len]:
-                if isinstance(forces, dict):
-                    side_forces.append(np.linalg.norm(forces.get('side_force', [0, 0, 0])))
-                else:
-                    side_forces.append(0)
-            
-            if any(f > 0.001 for f in side_forces):  # Only plot if there's significant side force
-                self.plot_widget.plot(times, side_forces, pen=pg.mkPen(color='cyan', width=2), name='Side')
-        
-        self.plot_widget.setLabel('left', 'Force (N)', color='white', size='12pt')
-        self.plot_widget.setLabel('bottom', 'Time (s)', color='white', size='12pt')
-        self.plot_widget.setTitle('Forces vs Time', color='white', size='14pt')
-        
-        # Add legend with better styling
-        legend = self.plot_widget.addLegend()
-        legend.setLabelTextColor('white')
+        self._set_labels('Force (N)', 'Time (s)', 'Forces vs Time')
+        
+        drag_forces, lift_forces, total_forces, side_forces = self._buf_forces[:self._buf_n].T
+        
+        # Use brighter colors and thicker lines
+        self._curve('drag', pen=self._pen_red, name='Drag').setData(*_decimate(times, drag_forces))
+        self._curve('lift', pen=self._pen_lime, name='Lift').setData(*_decimate(times, lift_forces))
+        self._curve('total', pen=self._pen_white, name='Total').setData(*_decimate(times, total_forces))
+        
+        # Add side force if available
+        side_curve = self._curve('side', pen=self._pen_cyan, name='Side')
+        if np.any(side_forces > 1e-3):  # Only show if there's significant side force
+            side_curve.setData(*_decimate(times, side_forces))
+            side_curve.setVisible(True)
+        else:
+            side_curve.setVisible(False)
         
     def _plot_position_time(self):
         """Plot position vs time"""
-        if not hasattr(self.results, 'position_history') or not self.results.position_history:
+        if self.results.position_history.size == 0:
             self.plot_widget.setTitle("No position data available", color='yellow', size='12pt')
             return
             
-        times = np.array(self.results.time_history)
-        positions = np.array(self.results.position_history)
+        times = self._buf_times[:self._buf_n]
+        positions = self._buf_pos[:self._buf_n]
         
-        if len(positions) == 0 or len(times) == 0:
+        if len(positions) == 0:
             self.plot_widget.setTitle("No position data available", color='yellow', size='12pt')
             return
+            
+        self._set_labels('Position (m)', 'Time (s)', 'Position vs Time')
         
-        # Ensure data consistency
-        min_len = min(len(times), len(positions))
-        times = times[:min_len]
-        positions = positions[:min_len]
-        
-        if positions.ndim == 1:
-            # Handle 1D position data
-            self.plot_widget.plot(times, positions, pen=pg.mkPen(color='white', width=3), name='Position')
-        else:
-            # Handle 3D position data
-            if positions.shape[1] >= 3:
-                self.plot_widget.plot(times, positions[:, 0], pen=pg.mkPen(color='red', width=2), name='X')
-                self.plot_widget.plot(times, positions[:, 1], pen=pg.mkPen(color='lime', width=2), name='Y')
-                self.plot_widget.plot(times, positions[:, 2], pen=pg.mkPen(color='cyan', width=2), name='Z')
-        
-        self.plot_widget.setLabel('left', 'Position (m)', color='white', size='12pt')
-        self.plot_widget.setLabel('bottom', 'Time (s)', color='white', size='12pt')
-        self.plot_widget.setTitle('Position vs Time', color='white', size='14pt')
-        
-        # Add legend with better styling
-        legend = self.plot_widget.addLegend()
-        legend.setLabelTextColor('white')
+        self._curve('x', pen=self._pen_red, name='X').setData(*_decimate(times, positions[:, 0]))
+        self._curve('y', pen=self._pen_lime, name='Y').setData(*_decimate(times, positions[:, 1]))
+        self._curve('z', pen=self._pen_cyan, name='Z').setData(*_decimate(times, positions[:, 2]))
         
     def _plot_energy_time(self):
         """Plot energy vs time"""
-        if not hasattr(self.results, 'velocity_history') or not self.results.velocity_history:
+        if self.results.velocity_history.size == 0:
             self.plot_widget.setTitle("No velocity data available for energy calculation", color='yellow', size='12pt')
             return
             
-        times = np.array(self.results.time_history)
-        velocities = np.array(self.results.velocity_history)
-        positions = np.array(self.results.position_history)
+        times = self._buf_times[:self._buf_n]
+        velocities = self._buf_vel[:self._buf_n]
+        positions = self._buf_pos[:self._buf_n]
         
-        if len(velocities) == 0 or len(times) == 0:
+        if len(velocities) == 0:
             self.plot_widget.setTitle("No data available for energy calculation", color='yellow', size='12pt')
             return
             
-        # Ensure data consistency
-        min_len = min(len(times), len(velocities), len(positions))
-        times = times[:min_len]
-        velocities = velocities[:min_len]
-        positions = positions[:min_len]
+        self._set_labels('Energy (J/kg)', 'Time (s)', 'Energy vs Time')
         
         # Calculate energies (assuming unit mass)
-        if velocities.ndim == 1:
-            speeds = np.abs(velocities)
-        else:
-            speeds = np.linalg.norm(velocities, axis=1)
-            
+        speeds = np.linalg.norm(velocities, axis=1)
         kinetic_energy = 0.5 * speeds**2
         
         # Calculate potential energy (assuming gravity in Y direction)
-        if positions.ndim == 1:
-            potential_energy = 9.81 * positions
-        else:
-            potential_energy = 9.81 * positions[:, 1]  # mgh, assuming g = 9.81
+        potential_energy = 9.81 * positions[:, 1]  # mgh, assuming g = 9.81
             
         total_energy = kinetic_energy + potential_energy
         
         # Plot with better visibility
-        self.plot_widget.plot(times, kinetic_energy, pen=pg.mkPen(color='red', width=2), name='Kinetic')
-        self.plot_widget.plot(times, potential_energy, pen=pg.mkPen(color='lime', width=2), name='Potential')
-        self.plot_widget.plot(times, total_energy, pen=pg.mkPen(color='white', width=3), name='Total')
-        
-        self.plot_widget.setLabel('left', 'Energy (J/kg)', color='white', size='12pt')
-        self.plot_widget.setLabel('bottom', 'Time (s)', color='white', size='12pt')
-        self.plot_widget.setTitle('Energy vs Time', color='white', size='14pt')
-        
-        # Add legend with better styling
-        legend = self.plot_widget.addLegend()
-        legend.setLabelTextColor('white')
+        self._curve('kinetic', pen=self._pen_red, name='Kinetic').setData(*_decimate(times, kinetic_energy))
+        self._curve('potential', pen=self._pen_lime, name='Potential').setData(*_decimate(times, potential_energy))
+        self._curve('total', pen=self._pen_white, name='Total').setData(*_decimate(times, total_energy))
         
     def _plot_coefficients_time(self):
         """Plot aerodynamic coefficients vs time"""
-        if not hasattr(self.results, 'force_history') or not self.results.force_history:
+        if not self.results.force_history:
             self.plot_widget.setTitle("No force data available for coefficients", color='yellow', size='12pt')
             return
             
-        times = np.array(self.results.time_history)
+        times = self._buf_times[:self._buf_n]
         
         if len(times) == 0:
             self.plot_widget.setTitle("No time data available", color='yellow', size='12pt')
             return
             
-        cd_values = []
-        cl_values = []
-        reynolds_values = []
-        
-        for forces in self.results.force_history:
-            if isinstance(forces, dict):
-                coeffs = forces.get('coefficients', {})
-                cd_values.append(coeffs.get('cd', 0))
-                cl_values.append(coeffs.get('cl', 0))
-                reynolds_values.append(coeffs.get('reynolds', 0))
-            else:
-                cd_values.append(0)
-                cl_values.append(0)
-                reynolds_values.append(0)
-        
-        # Ensure data consistency
-        min_len = min(len(times), len(cd_values))
-        times = times[:min_len]
-        cd_values = np.array(cd_values[:min_len])
-        cl_values = np.array(cl_values[:min_len])
-        reynolds_values = np.array(reynolds_values[:min_len])
-        
-        if min_len > 0:
-            # Plot coefficients with better visibility
-            self.plot_widget.plot(times, cd_values, pen=pg.mkPen(color='red', width=2), name='Cd (Drag)')
-            self.plot_widget.plot(times, cl_values, pen=pg.mkPen(color='lime', width=2), name='Cl (Lift)')
-            
-            # Only plot Reynolds number if it varies significantly
-            if np.std(reynolds_values) > 100:  # Only if there's significant variation
-                # Normalize Reynolds number for plotting (divide by 1000 for readability)
-                reynolds_normalized = reynolds_values / 1000
-                self.plot_widget.plot(times, reynolds_normalized, pen=pg.mkPen(color='cyan', width=2), name='Re/1000')
-        
-        self.plot_widget.setLabel('left', 'Coefficient', color='white', size='12pt')
-        self.plot_widget.setLabel('bottom', 'Time (s)', color='white', size='12pt')
-        self.plot_widget.setTitle('Aerodynamic Coefficients vs Time', color='white', size='14pt')
-        
-        # Add legend with better styling
-        legend = self.plot_widget.addLegend()
-        legend.setLabelTextColor('white')
+        self._set_labels('Coefficient', 'Time (s)', 'Aerodynamic Coefficients vs Time')
+        
+        cd_values, cl_values, reynolds_values = self._buf_coeffs[:self._buf_n].T
+        
+        # Plot coefficients with better visibility
+        self._curve('cd', pen=self._pen_red, name='Cd (Drag)').setData(*_decimate(times, cd_values))
+        self._curve('cl', pen=self._pen_lime, name='Cl (Lift)').setData(*_decimate(times, cl_values))
+        
+        # Only plot Reynolds number if it varies significantly
+        if np.std(reynolds_values) > 100:  # Only if there's significant variation
+            # Normalize Reynolds number for plotting (divide by 1000 for readability)
+            reynolds_normalized = reynolds_values / 1000
+            self._curve('re', pen=self._pen_cyan, name='Re/1000').setData(*_decimate(times, reynolds_normalized))
+        else:
+            self._drop_curve('re')
         
     def _plot_trajectory_2d(self):
         """Plot 2D trajectory"""
-        if not hasattr(self.results, 'position_history') or not self.results.position_history:
+        if self.results.position_history.size == 0:
             self.plot_widget.setTitle("No position data available for trajectory", color='yellow', size='12pt')
             return
             
-        positions = np.array(self.results.position_history)
+        positions = self._buf_pos[:self._buf_n]
         
         if len(positions) == 0:
             self.plot_widget.setTitle("No position data available for trajectory", color='yellow', size='12pt')
             return
-        
-        if positions.ndim == 1 or positions.shape[1] < 2:
-            self.plot_widget.setTitle("Insufficient position data for 2D trajectory", color='yellow', size='12pt')
-            return
             
+        self._set_labels('Y Position (m)', 'X Position (m)', '2D Trajectory')
+        
         # Plot trajectory with thicker line
-        self.plot_widget.plot(positions[:, 0], positions[:, 1], pen=pg.mkPen(color='white', width=3))
+        self._curve('path', pen=self._pen_white).setData(positions[:, 0], positions[:, 1])
         
         # Add start and end markers with better visibility
-        if len(positions) > 0:
-            self.plot_widget.plot([positions[0, 0]], [positions[0, 1]], 
-                                pen=None, symbol='o', symbolBrush='lime', symbolSize=12, name='Start')
+        self._curve('start', pen=None, symbol='o', symbolBrush='lime', symbolSize=12, 
+                    name='Start').setData([positions[0, 0]], [positions[0, 1]])
         if len(positions) > 1:
-            self.plot_widget.plot([positions[-1, 0]], [positions[-1, 1]], 
-                                pen=None, symbol='s', symbolBrush='red', symbolSize=12, name='End')
+            self._curve('end', pen=None, symbol='s', symbolBrush='red', symbolSize=12, 
+                        name='End').setData([positions[-1, 0]], [positions[-1, 1]])
+        else:
+            self._drop_curve('end')
         
         # Add direction arrows if trajectory is long enough
         if len(positions) > 10:
             # Sample some points along the trajectory for arrows
             step = max(1, len(positions) // 10)
-            for i in range(step, len(positions), step):
-                if i < len(positions) - 1:
-                    dx = positions[i+1, 0] - positions[i, 0]
-                    dy = positions[i+1, 1] - positions[i, 1]
-                    if abs(dx) > 1e-6 or abs(dy) > 1e-6:  # Only draw if there's movement
-                        arrow = pg.ArrowItem(angle=np.degrees(np.arctan2(dy, dx)), 
-                                           headLen=20, tailLen=20, pen='cyan', brush='cyan')
-                        arrow.setPos(positions[i, 0], positions[i, 1])
-                        self.plot_widget.addItem(arrow)
-        
-        self.plot_widget.setLabel('left', 'Y Position (m)', color='white', size='12pt')
-        self.plot_widget.setLabel('bottom', 'X Position (m)', color='white', size='12pt')
-        self.plot_widget.setTitle('2D Trajectory', color='white', size='14pt')
-        
-        # Add legend with better styling
-        legend = self.plot_widget.addLegend()
-        legend.setLabelTextColor('white')
+            idx = np.arange(step, len(positions) - 1, step)
+            dx = positions[idx + 1, 0] - positions[idx, 0]
+            dy = positions[idx + 1, 1] - positions[idx, 1]
+            moving = (np.abs(dx) > 1e-6) | (np.abs(dy) > 1e-6)  # Only draw if there's movement
+            angles = np.degrees(np.arctan2(dy[moving], dx[moving]))
+            self._draw_arrows(positions[idx[moving], 0], positions[idx[moving], 1], angles)
+        else:
+            self._draw_arrows([], [], [])
+        
+    def _draw_arrows(self, xs, ys, angles):
+        """Place direction arrows, reusing pooled ArrowItems between replots"""
+        while len(self._arrow_pool) < len(angles):
+            self._arrow_pool.append(pg.ArrowItem(headLen=20, tailLen=20, pen='cyan', brush='cyan'))
+            
+        plot_items = self.plot_widget.getPlotItem().items
+        for arrow, x, y, angle in zip(self._arrow_pool, xs, ys, angles):
+            arrow.setStyle(angle=angle)
+            arrow.setPos(x, y)
+            arrow.setVisible(True)
+            if arrow not in plot_items:
+                self.plot_widget.addItem(arrow)
+            
+        # Hide the unused tail of the pool
+        for arrow in self._arrow_pool[len(angles):]:
+            arrow.setVisible(False)
         
     def _plot_phase_space(self):
         """Plot phase space (position vs velocity)"""
-        if not hasattr(self.results, 'position_history') or not self.results.position_history:
+        if self.results.position_history.size == 0:
             self.plot_widget.setTitle("No position data available for phase space", color='yellow', size='12pt')
             return
             
-        if not hasattr(self.results, 'velocity_history') or not self.results.velocity_history:
+        if self.results.velocity_history.size == 0:
             self.plot_widget.setTitle("No velocity data available for phase space", color='yellow', size='12pt')
             return
             
-        positions = np.array(self.results.position_history)
-        velocities = np.array(self.results.velocity_history)
+        positions = self._buf_pos[:self._buf_n]
+        velocities = self._buf_vel[:self._buf_n]
         
-        if len(positions) == 0 or len(velocities) == 0:
+        if len(positions) == 0:
             self.plot_widget.setTitle("No data available for phase space", color='yellow', size='12pt')
             return
-        
-        # Ensure data consistency
-        min_len = min(len(positions), len(velocities))
-        positions = positions[:min_len]
-        velocities = velocities[:min_len]
-        
-        if positions.ndim == 1 or velocities.ndim == 1:
-            self.plot_widget.setTitle("Insufficient dimensional data for phase space", color='yellow', size='12pt')
-            return
             
-        if positions.shape[1] < 2 or velocities.shape[1] < 2:
-            self.plot_widget.setTitle("Insufficient dimensional data for phase space", color='yellow', size='12pt')
-            return
-            
-        # Plot X position vs X velocity and Y position vs Y velocity
-        self.plot_widget.plot(positions[:, 0], velocities[:, 0], pen=pg.mkPen(color='red', width=2), name='X phase')
-        self.plot_widget.plot(positions[:, 1], velocities[:, 1], pen=pg.mkPen(color='lime', width=2), name='Y phase')
+        self._set_labels('Velocity (m/s)', 'Position (m)', 'Phase Space')
         
-        # Add start and end markers
-        if len(positions) > 0:
-            self.plot_widget.plot([positions[0, 0]], [velocities[0, 0]], 
-                                pen=None, symbol='o', symbolBrush='cyan', symbolSize=10, name='X Start')
-            self.plot_widget.plot([positions[0, 1]], [velocities[0, 1]], 
-                                pen=None, symbol='o', symbolBrush='yellow', symbolSize=10, name='Y Start')
-        
-        self.plot_widget.setLabel('left', 'Velocity (m/s)', color='white', size='12pt')
-        self.plot_widget.setLabel('bottom', 'Position (m)', color='white', size='12pt')
-        self.plot_widget.setTitle('Phase Space', color='white', size='14pt')
+        # Plot X position vs X velocity and Y position vs Y velocity
+        self._curve('x', pen=self._pen_red, name='X phase').setData(positions[:, 0], velocities[:, 0])
+        self._curve('y', pen=self._pen_lime, name='Y phase').setData(positions[:, 1], velocities[:, 1])
         
-        # Add legend with better styling
-        legend = self.plot_widget.addLegend()
-        legend.setLabelTextColor('white')
+        # Add start markers
+        self._curve('x_start', pen=None, symbol='o', symbolBrush='cyan', symbolSize=10, 
+                    name='X Start').setData([positions[0, 0]], [velocities[0, 0]])
+        self._curve('y_start', pen=None, symbol='o', symbolBrush='yellow', symbolSize=10, 
+                    name='Y Start').setData([positions[0, 1]], [velocities[0, 1]])
         
     def clear(self):
         """Clear the plot"""
-        self.plot_widget.clear()
\ No newline at end of file
+        self._reset_plot()
\ No newline at end of file
@@ -0,0 +1,19 @@
+"""
+Optional Numba JIT support
+
+Kernels are decorated with ``njit`` from here so they compile when numba is
+installed and run as plain Python/NumPy otherwise.
+"""
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that returns the function unchanged"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
@@ -4,11 +4,49 @@ Handles air flow simulation, drag calculations, and aerodynamic analysis
 """
 
 import numpy as np
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, List, NamedTuple, Tuple, Optional, Union
 from dataclasses import dataclass
 from enum import Enum
 import math
 
+from ..jit import njit, prange
+from .gpu import CUPY_AVAILABLE, GPU_MIN_CELLS, generate_flow_field_gpu
+
+# Drag coefficient models. Sphere, cylinder and jet drag vary with the flow
+# speed; the other object types have a drag coefficient fixed by the angle.
+CD_FIXED, CD_SPHERE, CD_CYLINDER, CD_JET = range(4)
+
+# Integration steps per flow field streamline
+STREAMLINE_MAX_STEPS = 1000
+
+# Flow field arrays are single precision; the model is far coarser than that
+FLOW_DTYPE = np.float32
+
+def _norm3(v) -> float:
+    """Euclidean norm of a 3-vector, without np.linalg.norm's dispatch overhead"""
+    return math.sqrt(v[0] * v[0] + v[1] * v[1] + v[2] * v[2])
+
+@njit(cache=True)
+def _drag_coefficient_kernel(model, cd_base, reynolds, mach):
+    """Drag coefficient from a drag model and its angle-dependent part cd_base"""
+    if model == CD_SPHERE:
+        if reynolds < 1:
+            return 24 / reynolds  # Stokes flow
+        elif reynolds < 1000:
+            return 24 / reynolds * (1 + 0.15 * (reynolds ** 0.687))
+        return 0.44  # Turbulent flow
+    elif model == CD_CYLINDER:
+        if reynolds < 1:
+            return 8 * math.pi / reynolds
+        elif reynolds < 40:
+            return 1.0
+        elif reynolds < 1000:
+            return 1.2
+        return 0.3
+    elif model == CD_JET and mach > 0.8:
+        return cd_base + 0.05 * ((mach - 0.8) ** 2)  # Wave drag
+    return cd_base
+
 class ObjectType(Enum):
     JET = "jet"
     SPHERE = "sphere"
@@ -47,12 +85,150 @@ class SimulationState:
     acceleration: np.ndarray
     angular_velocity: np.ndarray
     time: float
-    forces: Dict[str, np.ndarray]
+    forces: Union['ForceResult', Dict[str, np.ndarray]]  # {} before the first step
     moments: Dict[str, np.ndarray]
 
+class ForceResult(NamedTuple):
+    """Forces and coefficients from one calculate_forces call"""
+    drag: np.ndarray
+    lift: np.ndarray
+    side_force: np.ndarray
+    total: np.ndarray
+    cd: float = 0.0
+    cl: float = 0.0
+    reynolds: float = 0.0
+    mach: float = 0.0
+    
+    def to_dict(self) -> Dict:
+        """Legacy force dict, with the coefficients nested under 'coefficients'"""
+        return {
+            'drag': self.drag,
+            'lift': self.lift,
+            'side_force': self.side_force,
+            'total': self.total,
+            'coefficients': {'cd': self.cd, 'cl': self.cl,
+                             'reynolds': self.reynolds, 'mach': self.mach}
+        }
+    
+    @classmethod
+    def from_dict(cls, forces: Dict) -> 'ForceResult':
+        """Build from a legacy force dict; missing coefficients are zero"""
+        coeffs = forces.get('coefficients', {})
+        return cls(forces['drag'], forces['lift'], forces['side_force'], forces['total'],
+                   coeffs.get('cd', 0.0), coeffs.get('cl', 0.0),
+                   coeffs.get('reynolds', 0.0), coeffs.get('mach', 0.0))
+
+@njit(cache=True)
+def _nearest_node(grid, start, step, n, value):
+    """Index of the uniform grid node nearest to value, clamped to the grid"""
+    # The bracketing pair is compared on the actual node values so that
+    # near-ties resolve exactly as an argmin over the grid would
+    if not math.isfinite(value):
+        return 0  # argmin over all-NaN or all-inf distances picks the first node
+    i = min(max(math.floor((value - start) / step), 0), n - 2)
+    if abs(grid[i + 1] - value) < abs(grid[i] - value):
+        i += 1
+    return i
+
+@njit(parallel=True, cache=True)
+def _trace_all_streamlines(x_grid, y_grid, u, v, start_x, start_ys, max_x, dt,
+                           sx, sy, lengths):
+    """Trace one streamline per start height through the flow field
+    
+    Fills row k of the caller's sx and sy buffers with lengths[k] points; the
+    buffer width bounds the number of steps.
+    """
+    n_lines = len(start_ys)
+    max_steps = sx.shape[1] - 1
+    
+    # The grids are uniform, so the nearest node follows from the spacing
+    x0, dx, nx = x_grid[0], x_grid[1] - x_grid[0], len(x_grid)
+    y0, dy, ny = y_grid[0], y_grid[1] - y_grid[0], len(y_grid)
+    
+    for k in prange(n_lines):
+        current_x, current_y = start_x, start_ys[k]
+        sx[k, 0] = current_x
+        sy[k, 0] = current_y
+        count = 1
+        
+        for _ in range(max_steps):
+            if current_x > max_x or current_x < -max_x:
+                break
+                
+            # Simple nearest neighbor interpolation; points outside the grid
+            # take the velocity of the nearest edge node
+            i = _nearest_node(x_grid, x0, dx, nx, current_x)
+            j = _nearest_node(y_grid, y0, dy, ny, current_y)
+            
+            # Update position
+            current_x += u[j, i] * dt
+            current_y += v[j, i] * dt
+            
+            sx[k, count] = current_x
+            sy[k, count] = current_y
+            count += 1
+            
+        lengths[k] = count
+        
+    return sx, sy, lengths
+
+# Angle-dependent coefficient terms per object type, dispatched by
+# AerodynamicsEngine. Drag functions return (drag model, angle-dependent part).
+
+def _jet_drag(angle: float) -> Tuple[int, float]:
+    # Jet aircraft drag coefficient (simplified)
+    base_cd = 0.02  # Very low drag for streamlined jet
+    # Angle of attack effect; wave drag is added per Mach number
+    induced_drag = 0.1 * (math.radians(angle) ** 2)
+    return CD_JET, base_cd + induced_drag
+
+def _sphere_drag(angle: float) -> Tuple[int, float]:
+    return CD_SPHERE, 0.0
+
+def _cylinder_drag(angle: float) -> Tuple[int, float]:
+    return CD_CYLINDER, 0.0
+
+def _cube_drag(angle: float) -> Tuple[int, float]:
+    angle_rad = math.radians(angle)
+    return CD_FIXED, 1.05 + 0.2 * abs(math.sin(2 * angle_rad))
+
+def _airfoil_drag(angle: float) -> Tuple[int, float]:
+    base_cd = 0.01
+    induced_drag = 0.05 * (math.radians(angle) ** 2)
+    return CD_FIXED, base_cd + induced_drag
+
+def _default_drag(angle: float) -> Tuple[int, float]:
+    return CD_FIXED, 0.5
+
+def _jet_lift(angle: float) -> float:
+    # Simplified jet lift
+    angle_rad = math.radians(angle)
+    return 0.8 * math.sin(2 * angle_rad) * (1 - abs(angle_rad) / math.pi)
+
+def _airfoil_lift(angle: float) -> float:
+    # Airfoil lift (simplified)
+    angle_rad = math.radians(angle)
+    return 2 * math.pi * angle_rad * (1 - abs(angle_rad) / (math.pi/4))
+
+def _body_lift(angle: float) -> float:
+    # Minimal lift for non-lifting bodies
+    return 0.1 * math.sin(2 * math.radians(angle))
+
 class AerodynamicsEngine:
     """Advanced aerodynamics simulation engine"""
     
+    _CD_FUNCS = {
+        ObjectType.JET: _jet_drag,
+        ObjectType.SPHERE: _sphere_drag,
+        ObjectType.CYLINDER: _cylinder_drag,
+        ObjectType.CUBE: _cube_drag,
+        ObjectType.AIRFOIL: _airfoil_drag,
+    }
+    _CL_FUNCS = {
+        ObjectType.JET: _jet_lift,
+        ObjectType.AIRFOIL: _airfoil_lift,
+    }
+    
     def __init__(self):
         self.air_props = AirProperties()
         self.dt = 0.001  # Time step
@@ -60,6 +236,15 @@ class AerodynamicsEngine:
         self.flow_field = None
         self.pressure_field = None
         self.velocity_field = None
+        self._flow_cache = None  # (key, time-independent flow field terms)
+        self.backend = 'numpy'  # 'cupy' evaluates large flow fields on the GPU
+        self._last_angle = None  # (object type, angle) of _last_coeffs
+        self._last_coeffs = None
+        
+        # Shared read-only results for forces that are identically zero
+        self._zero3 = np.zeros(3)
+        self._zero3.setflags(write=False)
+        self._zero_forces = ForceResult(self._zero3, self._zero3, self._zero3, self._zero3)
         
     def calculate_reynolds_number(self, velocity: float, characteristic_length: float) -> float:
         """Calculate Reynolds number"""
@@ -69,94 +254,56 @@ class AerodynamicsEngine:
         """Calculate Mach number"""
         return velocity / self.air_props.speed_of_sound
     
+    def drag_model(self, obj_type: ObjectType, angle: float) -> Tuple[int, float]:
+        """Drag coefficient model of an object type and its angle-dependent part"""
+        return self._CD_FUNCS.get(obj_type, _default_drag)(angle)
+    
+    def angle_coefficients(self, obj_type: ObjectType, angle: float) -> Tuple[int, float, float]:
+        """Drag model, angle-dependent drag part and lift coefficient
+        
+        The angle rarely changes during a run, so the last result is reused.
+        """
+        key = (obj_type, angle)
+        if key != self._last_angle:
+            model, cd_base = self.drag_model(obj_type, angle)
+            self._last_coeffs = (model, cd_base, self.calculate_lift_coefficient(obj_type, angle, 0.0))
+            self._last_angle = key
+        return self._last_coeffs
+    
     def get_drag_coefficient(self, obj_type: ObjectType, reynolds: float, mach: float, angle: float) -> float:
         """Calculate drag coefficient based on object type and flow conditions"""
-        angle_rad = math.radians(angle)
-        
-        if obj_type == ObjectType.JET:
-            # Jet aircraft drag coefficient (simplified)
-            base_cd = 0.02  # Very low drag for streamlined jet
-            # Angle of attack effect
-            induced_drag = 0.1 * (angle_rad ** 2)
-            # Mach number effects
-            if mach > 0.8:
-                wave_drag = 0.05 * ((mach - 0.8) ** 2)
-            else:
-                wave_drag = 0
-            return base_cd + induced_drag + wave_drag
-            
-        elif obj_type == ObjectType.SPHERE:
-            # Sphere drag coefficient
-            if reynolds < 1:
-                return 24 / reynolds  # Stokes flow
-            elif reynolds < 1000:
-                return 24 / reynolds * (1 + 0.15 * (reynolds ** 0.687))
-            else:
-                return 0.44  # Turbulent flow
-                
-        elif obj_type == ObjectType.CYLINDER:
-            # Cylinder drag coefficient
-            if reynolds < 1:
-                return 8 * math.pi / reynolds
-            elif reynolds < 40:
-                return 1.0
-            elif reynolds < 1000:
-                return 1.2
-            else:
-                return 0.3
-                
-        elif obj_type == ObjectType.CUBE:
-            # Cube drag coefficient
-            return 1.05 + 0.2 * abs(math.sin(2 * angle_rad))
-            
-        elif obj_type == ObjectType.AIRFOIL:
-            # Airfoil drag coefficient
-            base_cd = 0.01
-            induced_drag = 0.05 * (angle_rad ** 2)
-            return base_cd + induced_drag
-            
-        return 0.5  # Default
+        model, cd_base = self.drag_model(obj_type, angle)
+        return _drag_coefficient_kernel(model, cd_base, reynolds, mach)
     
     def calculate_lift_coefficient(self, obj_type: ObjectType, angle: float, reynolds: float) -> float:
         """Calculate lift coefficient"""
-        angle_rad = math.radians(angle)
-        
-        if obj_type == ObjectType.JET:
-            # Simplified jet lift
-            return 0.8 * math.sin(2 * angle_rad) * (1 - abs(angle_rad) / math.pi)
-        elif obj_type == ObjectType.AIRFOIL:
-            # Airfoil lift (simplified)
-            return 2 * math.pi * angle_rad * (1 - abs(angle_rad) / (math.pi/4))
-        else:
-            # Minimal lift for non-lifting bodies
-            return 0.1 * math.sin(2 * angle_rad)
+        return self._CL_FUNCS.get(obj_type, _body_lift)(angle)
     
     def calculate_forces(self, geometry: ObjectGeometry, velocity: np.ndarray, 
-                        angle: float, wind_velocity: np.ndarray) -> Dict[str, np.ndarray]:
+                        angle: float, wind_velocity: np.ndarray) -> ForceResult:
         """Calculate all aerodynamic forces"""
+        air = self.air_props
+        rho, mu, sound_speed = air.density, air.viscosity, air.speed_of_sound
+        
         # Relative velocity (object velocity relative to air)
         relative_velocity = velocity - wind_velocity
-        speed = np.linalg.norm(relative_velocity)
+        speed = _norm3(relative_velocity)
         
         if speed < 1e-6:
-            return {
-                'drag': np.zeros(3),
-                'lift': np.zeros(3),
-                'side_force': np.zeros(3),
-                'total': np.zeros(3)
-            }
+            return self._zero_forces  # Shared; its arrays are read-only
         
         # Unit vector in direction of relative velocity
-        velocity_unit = relative_velocity / speed
+        relative_velocity *= 1.0 / speed
+        velocity_unit = relative_velocity
         
-        # Calculate coefficients
-        reynolds = self.calculate_reynolds_number(speed, geometry.length)
-        mach = self.calculate_mach_number(speed)
-        cd = self.get_drag_coefficient(geometry.object_type, reynolds, mach, angle)
-        cl = self.calculate_lift_coefficient(geometry.object_type, angle, reynolds)
+        # Calculate coefficients (Reynolds and Mach numbers inlined)
+        reynolds = (rho * speed * geometry.length) / mu
+        mach = speed / sound_speed
+        cd_model, cd_base, cl = self.angle_coefficients(geometry.object_type, angle)
+        cd = _drag_coefficient_kernel(cd_model, cd_base, reynolds, mach)
         
         # Dynamic pressure
-        q = 0.5 * self.air_props.density * speed ** 2
+        q = 0.5 * rho * speed ** 2
         
         # Drag force (opposite to velocity direction)
         drag_magnitude = cd * geometry.frontal_area * q
@@ -172,66 +319,57 @@ class AerodynamicsEngine:
         lift_force = lift_magnitude * lift_direction
         
         # Side force (simplified)
-        side_force = np.zeros(3)
+        side_force = self._zero3
         
         total_force = drag_force + lift_force + side_force
         
-        return {
-            'drag': drag_force,
-            'lift': lift_force,
-            'side_force': side_force,
-            'total': total_force,
-            'coefficients': {'cd': cd, 'cl': cl, 'reynolds': reynolds, 'mach': mach}
-        }
+        return ForceResult(drag_force, lift_force, side_force, total_force,
+                           cd, cl, reynolds, mach)
     
     def generate_flow_field(self, geometry: ObjectGeometry, velocity: np.ndarray, 
                            angle: float, domain_size: Tuple[float, float]) -> Dict:
         """Generate flow field around object"""
         x_max, y_max = domain_size
-        x = np.linspace(-x_max/2, x_max/2, self.grid_size[0])
-        y = np.linspace(-y_max/2, y_max/2, self.grid_size[1])
-        X, Y = np.meshgrid(x, y)
         
         # Simplified flow field calculation
         # This is a basic potential flow approximation
-        speed = np.linalg.norm(velocity[:2])  # 2D projection
+        speed = math.sqrt(velocity[0] * velocity[0] + velocity[1] * velocity[1])  # 2D projection
         
-        # Object center (assume at origin)
-        obj_x, obj_y = 0, 0
         obj_radius = max(geometry.width, geometry.height) / 2
+        grid = self._get_flow_grid(domain_size, obj_radius)
+        x, y = grid['x'], grid['y']
         
-        # Distance from object center
-        R = np.sqrt((X - obj_x)**2 + (Y - obj_y)**2)
-        
-        # Avoid singularity at object center
-        R = np.maximum(R, obj_radius)
-        
-        # Potential flow around cylinder (simplified)
-        # Stream function for flow around cylinder
-        theta = np.arctan2(Y - obj_y, X - obj_x)
+        if (self.backend == 'cupy' and CUPY_AVAILABLE
+                and self.grid_size[0] * self.grid_size[1] > GPU_MIN_CELLS):
+            return generate_flow_field_gpu(grid, speed, self.air_props.density,
+                                           self.air_props.pressure, -x_max/2, x_max,
+                                           0.01, STREAMLINE_MAX_STEPS)
         
-        # Velocity components (potential flow)
-        u = speed * (1 - (obj_radius/R)**2 * np.cos(2*theta))
-        v = -speed * (obj_radius/R)**2 * np.sin(2*theta)
+        # Velocity components (potential flow); only the free-stream speed
+        # changes between calls
+        u = np.multiply(grid['inv_R2_c2'], -speed)
+        u += speed
+        v = np.multiply(grid['inv_R2_s2'], -speed)
         
         # Pressure field (Bernoulli's equation)
-        velocity_magnitude = np.sqrt(u**2 + v**2)
-        pressure = self.air_props.pressure + 0.5 * self.air_props.density * (speed**2 - velocity_magnitude**2)
-        
-        # Streamlines
-        streamlines_x = []
-        streamlines_y = []
+        speed2 = u * u
+        speed2 += v * v
+        velocity_magnitude = np.sqrt(speed2)
+        pressure = np.subtract(speed**2, speed2, out=speed2)
+        pressure *= 0.5 * self.air_props.density
+        pressure += self.air_props.pressure
         
-        # Generate streamlines
-        for start_y in np.linspace(-y_max/3, y_max/3, 10):
-            if abs(start_y) > obj_radius * 1.5:  # Avoid object
-                sx, sy = self._trace_streamline(x, y, u, v, -x_max/2, start_y, x_max)
-                streamlines_x.append(sx)
-                streamlines_y.append(sy)
+        # Streamlines, written into one buffer owned by this flow field
+        starts = grid['streamline_starts']
+        sx, sy = np.empty((2, len(starts), STREAMLINE_MAX_STEPS + 1), dtype=FLOW_DTYPE)
+        lengths = np.empty(len(starts), dtype=np.int64)
+        _trace_all_streamlines(x, y, u, v, -x_max/2, starts, x_max, 0.01, sx, sy, lengths)
+        streamlines_x = [sx[k, :n] for k, n in enumerate(lengths)]
+        streamlines_y = [sy[k, :n] for k, n in enumerate(lengths)]
         
         return {
-            'x': X,
-            'y': Y,
+            'x': grid['X'],
+            'y': grid['Y'],
             'u': u,
             'v': v,
             'pressure': pressure,
@@ -240,47 +378,59 @@ class AerodynamicsEngine:
             'streamlines_y': streamlines_y
         }
     
-    def _trace_streamline(self, x_grid, y_grid, u, v, start_x, start_y, max_x):
-        """Trace a streamline through the flow field"""
-        dt = 0.01
-        max_steps = 1000
+    def _get_flow_grid(self, domain_size: Tuple[float, float], obj_radius: float) -> Dict:
+        """Return the flow field terms that don't depend on the flow speed"""
+        key = (tuple(self.grid_size), tuple(domain_size), obj_radius)
+        if self._flow_cache is not None and self._flow_cache[0] == key:
+            return self._flow_cache[1]
+            
+        x_max, y_max = domain_size
+        x = np.linspace(-x_max/2, x_max/2, self.grid_size[0])
+        y = np.linspace(-y_max/2, y_max/2, self.grid_size[1])
+        X, Y = np.meshgrid(x, y)
         
-        sx = [start_x]
-        sy = [start_y]
+        # Object center (assume at origin)
+        obj_x, obj_y = 0, 0
         
-        current_x, current_y = start_x, start_y
+        # Squared distance from object center
+        dx = X - obj_x
+        dy = Y - obj_y
+        R2 = dx * dx + dy * dy
         
-        for _ in range(max_steps):
-            if current_x > max_x or current_x < -max_x:
-                break
-                
-            # Interpolate velocity at current position
-            try:
-                # Simple nearest neighbor interpolation
-                i = np.argmin(np.abs(x_grid - current_x))
-                j = np.argmin(np.abs(y_grid - current_y))
-                
-                if 0 <= i < len(u[0]) and 0 <= j < len(u):
-                    vel_x = u[j, i]
-                    vel_y = v[j, i]
-                    
-                    # Update position
-                    current_x += vel_x * dt
-                    current_y += vel_y * dt
-                    
-                    sx.append(current_x)
-                    sy.append(current_y)
-                else:
-                    break
-            except:
-                break
+        # (obj_radius/R)^2, with R clamped to the object radius to avoid the
+        # singularity at the center
+        radius2 = obj_radius * obj_radius
+        inv_R2 = radius2 / np.maximum(R2, radius2)
         
-        return sx, sy
+        # Potential flow around cylinder (simplified)
+        # cos(2*theta) and sin(2*theta) from the double-angle identities, so
+        # no arctan2/cos/sin passes; theta is taken as 0 at the center
+        has_angle = R2 > 0
+        c2 = np.divide(dx * dx - dy * dy, R2, out=np.ones_like(R2), where=has_angle)
+        s2 = np.divide(2 * dx * dy, R2, out=np.zeros_like(R2), where=has_angle)
+        
+        grid = {
+            'x': x.astype(FLOW_DTYPE),
+            'y': y.astype(FLOW_DTYPE),
+            'X': X.astype(FLOW_DTYPE),
+            'Y': Y.astype(FLOW_DTYPE),
+            'inv_R2_c2': (inv_R2 * c2).astype(FLOW_DTYPE),
+            'inv_R2_s2': (inv_R2 * s2).astype(FLOW_DTYPE),
+            # Streamline seeds, skipping those that would start in the object
+            'streamline_starts': np.array([start_y for start_y in np.linspace(-y_max/3, y_max/3, 10)
+                                           if abs(start_y) > obj_radius * 1.5])
+        }
+        # Every returned flow field shares these arrays
+        for name in ('x', 'y', 'X', 'Y', 'inv_R2_c2', 'inv_R2_s2'):
+            grid[name].flags.writeable = False
+            
+        self._flow_cache = (key, grid)
+        return grid
     
-    def calculate_aerodynamic_efficiency(self, forces: Dict, geometry: ObjectGeometry) -> Dict:
+    def calculate_aerodynamic_efficiency(self, forces: ForceResult, geometry: ObjectGeometry) -> Dict:
         """Calculate aerodynamic efficiency metrics"""
-        drag_force = np.linalg.norm(forces['drag'])
-        lift_force = np.linalg.norm(forces['lift'])
+        drag_force = _norm3(forces.drag)
+        lift_force = _norm3(forces.lift)
         
         # Lift-to-drag ratio
         if drag_force > 1e-6:
@@ -298,6 +448,6 @@ class AerodynamicsEngine:
             'lift_to_drag_ratio': lift_to_drag,
             'drag_area': drag_area,
             'fineness_ratio': fineness_ratio,
-            'drag_coefficient': forces.get('coefficients', {}).get('cd', 0),
-            'lift_coefficient': forces.get('coefficients', {}).get('cl', 0)
+            'drag_coefficient': forces.cd,
+            'lift_coefficient': forces.cl
         }
\ No newline at end of file
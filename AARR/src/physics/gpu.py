@@ -0,0 +1,130 @@
+"""
+Optional CuPy flow field backend
+
+Large flow field grids can be evaluated on an NVIDIA GPU when CuPy is
+installed; otherwise AerodynamicsEngine keeps to NumPy.
+"""
+
+import numpy as np
+from typing import Dict
+
+try:
+    import cupy as cp
+    CUPY_AVAILABLE = True
+except ImportError:
+    cp = None
+    CUPY_AVAILABLE = False
+
+# Grids with at most this many cells stay on the CPU; below it the kernel
+# launches and transfers cost more than they save
+GPU_MIN_CELLS = 65536
+
+# One thread per streamline, mirroring _trace_all_streamlines
+_STREAMLINE_SOURCE = r'''
+__device__ int nearest_node(const float* grid, float start, float step, int n, double value)
+{
+    if (!isfinite(value)) {
+        return 0;
+    }
+    double f = floor((value - start) / step);
+    int i = (int)fmin(fmax(f, 0.0), (double)(n - 2));
+    if (fabs(grid[i + 1] - value) < fabs(grid[i] - value)) {
+        i += 1;
+    }
+    return i;
+}
+
+extern "C" __global__
+void trace_streamlines(const float* x_grid, const float* y_grid, int nx, int ny,
+                       const float* u, const float* v, double start_x,
+                       const double* start_ys, int n_lines, double max_x, double dt,
+                       int max_steps, float* sx, float* sy, long long* lengths)
+{
+    int k = blockDim.x * blockIdx.x + threadIdx.x;
+    if (k >= n_lines) {
+        return;
+    }
+    float dx = x_grid[1] - x_grid[0];
+    float dy = y_grid[1] - y_grid[0];
+    float* row_x = sx + (long long)k * (max_steps + 1);
+    float* row_y = sy + (long long)k * (max_steps + 1);
+
+    double current_x = start_x;
+    double current_y = start_ys[k];
+    row_x[0] = current_x;
+    row_y[0] = current_y;
+    int count = 1;
+
+    for (int step = 0; step < max_steps; step++) {
+        if (current_x > max_x || current_x < -max_x) {
+            break;
+        }
+        int i = nearest_node(x_grid, x_grid[0], dx, nx, current_x);
+        int j = nearest_node(y_grid, y_grid[0], dy, ny, current_y);
+        current_x += u[j * nx + i] * dt;
+        current_y += v[j * nx + i] * dt;
+        row_x[count] = current_x;
+        row_y[count] = current_y;
+        count += 1;
+    }
+    lengths[k] = count;
+}
+'''
+
+_trace_streamlines = (cp.RawKernel(_STREAMLINE_SOURCE, 'trace_streamlines')
+                      if CUPY_AVAILABLE else None)
+
+def generate_flow_field_gpu(grid: Dict, speed: float, density: float, ambient_pressure: float,
+                            start_x: float, max_x: float, dt: float, max_steps: int) -> Dict:
+    """GPU counterpart of the field and streamline part of generate_flow_field
+
+    grid is the engine's cached flow grid; its device copies are kept in it.
+    Returns host arrays in the same layout as the CPU path.
+    """
+    device = grid.get('device')
+    if device is None:
+        device = grid['device'] = {
+            name: cp.asarray(grid[name])
+            for name in ('x', 'y', 'inv_R2_c2', 'inv_R2_s2', 'streamline_starts')
+        }
+    x, y = device['x'], device['y']
+    starts = device['streamline_starts']
+
+    # Velocity components (potential flow)
+    u = device['inv_R2_c2'] * -speed
+    u += speed
+    v = device['inv_R2_s2'] * -speed
+
+    # Pressure field (Bernoulli's equation)
+    speed2 = u * u
+    speed2 += v * v
+    velocity_magnitude = cp.sqrt(speed2)
+    pressure = speed**2 - speed2
+    pressure *= 0.5 * density
+    pressure += ambient_pressure
+
+    # Streamlines
+    n_lines = len(starts)
+    sx = cp.empty((n_lines, max_steps + 1), dtype=u.dtype)
+    sy = cp.empty_like(sx)
+    lengths = cp.empty(n_lines, dtype=cp.int64)
+    if n_lines:
+        threads = 32
+        _trace_streamlines(
+            ((n_lines + threads - 1) // threads,), (threads,),
+            (x, y, np.int32(len(x)), np.int32(len(y)), u, v, np.float64(start_x),
+             starts, np.int32(n_lines), np.float64(max_x), np.float64(dt),
+             np.int32(max_steps), sx, sy, lengths)
+        )
+    sx, sy, lengths = sx.get(), sy.get(), lengths.get()
+
+    return {
+        'x': grid['X'],
+        'y': grid['Y'],
+        'u': u.get(),
+        'v': v.get(),
+        'pressure': pressure.get(),
+        'velocity_magnitude': velocity_magnitude.get(),
+        'streamlines_x': [sx[k, :n] for k, n in enumerate(lengths)],
+        'streamlines_y': [sy[k, :n] for k, n in enumerate(lengths)]
+    }
@@ -4,10 +4,139 @@ Handles the overall simulation state and time stepping
 """
 
 import numpy as np
-from typing import Dict, List, Optional, Callable
+from typing import Dict, List, Optional, Callable, Tuple
 from dataclasses import dataclass, field
-import time
-from .aerodynamics import AerodynamicsEngine, ObjectGeometry, SimulationState, ObjectType
+from collections.abc import Sequence
+import math
+import threading
+from ..jit import njit
+from .aerodynamics import (AerodynamicsEngine, ObjectGeometry, SimulationState, ObjectType,
+                           ForceResult, _drag_coefficient_kernel)
+
+# Upper bound on history rows allocated up front; longer runs grow the buffers
+MAX_PREALLOCATED_STEPS = 100000
+
+# Turbulence samples are drawn this many steps at a time
+TURBULENCE_BLOCK_STEPS = 1024
+
+# Interactive runs let the Qt event loop in every this many steps
+INTERACTIVE_EVENT_STEPS = 64
+
+# Steps integrated per compiled chunk in batch runs
+BATCH_CHUNK_STEPS = 1000
+
+# Flow fields and efficiency metrics are recorded every this many steps
+FLOW_FIELD_INTERVAL = 10
+
+# Rows per block of the AoSoA force buffers
+BLOCK = 8
+
+# Forces, accelerations and coefficients are recorded in single precision.
+# Positions, velocities and time stay double so the integration doesn't drift.
+HISTORY_DTYPE = np.float32
+
+@njit(cache=True)
+def _advance_chunk(positions, velocities, accelerations,
+                   drag, lift, side, total, cd, cl, reynolds, mach, times,
+                   n_start, n_steps, t0, dt, max_time, gravity, wind,
+                   turbulence, turbulence_intensity, wind_speed, density, viscosity, speed_of_sound,
+                   frontal_area, length, cd_model, cd_base, cl_value):
+    """Euler-integrate up to n_steps steps into rows n_start onward of the histories
+    
+    The kinematic buffers carry the leading initial-state row, so the state
+    at the start of the chunk is their row n_start. Returns the number of
+    steps taken and the final time.
+    """
+    px, py, pz = positions[n_start, 0], positions[n_start, 1], positions[n_start, 2]
+    vx, vy, vz = velocities[n_start, 0], velocities[n_start, 1], velocities[n_start, 2]
+    t = t0
+    taken = 0
+    for k in range(n_steps):
+        if t >= max_time:
+            break
+        i = n_start + k
+        
+        wx, wy, wz = wind[0], wind[1], wind[2]
+        if turbulence.shape[0] > 0:
+            wx = wx + turbulence[k, 0] * turbulence_intensity * wind_speed
+            wy = wy + turbulence[k, 1] * turbulence_intensity * wind_speed
+            wz = wz + turbulence[k, 2] * turbulence_intensity * wind_speed
+        
+        # Relative velocity (object velocity relative to air)
+        rx = vx - wx
+        ry = vy - wy
+        rz = vz - wz
+        speed = math.sqrt(rx * rx + ry * ry + rz * rz)
+        
+        dx = dy = dz = lx = ly = lz = 0.0
+        re = ma = c_d = c_l = 0.0
+        if speed >= 1e-6:
+            re = (density * speed * length) / viscosity
+            ma = speed / speed_of_sound
+            c_d = _drag_coefficient_kernel(cd_model, cd_base, re, ma)
+            c_l = cl_value
+            q = 0.5 * density * speed ** 2
+            
+            # Drag opposes the relative velocity
+            inv_speed = 1.0 / speed
+            drag_magnitude = c_d * frontal_area * q
+            dx = -drag_magnitude * (rx * inv_speed)
+            dy = -drag_magnitude * (ry * inv_speed)
+            dz = -drag_magnitude * (rz * inv_speed)
+            
+            # Simplified lift direction, as in AerodynamicsEngine.calculate_forces
+            lift_magnitude = c_l * frontal_area * q
+            if abs(rx * inv_speed) > 0.1:
+                ly = lift_magnitude
+            else:
+                lx = lift_magnitude
+        
+        tx = dx + lx + 0.0
+        ty = dy + ly + 0.0
+        tz = dz + lz + 0.0
+        
+        # Unit mass: acceleration is the total force plus gravity
+        ax = tx + gravity[0]
+        ay = ty + gravity[1]
+        az = tz + gravity[2]
+        vx += ax * dt
+        vy += ay * dt
+        vz += az * dt
+        px += vx * dt
+        py += vy * dt
+        pz += vz * dt
+        t += dt
+        
+        # Force buffers are AoSoA blocks (see AoSoA)
+        b, lane = i // BLOCK, i % BLOCK
+        positions[i + 1, 0] = px
+        positions[i + 1, 1] = py
+        positions[i + 1, 2] = pz
+        velocities[i + 1, 0] = vx
+        velocities[i + 1, 1] = vy
+        velocities[i + 1, 2] = vz
+        accelerations[i + 1, 0] = ax
+        accelerations[i + 1, 1] = ay
+        accelerations[i + 1, 2] = az
+        drag[b, 0, lane] = dx
+        drag[b, 1, lane] = dy
+        drag[b, 2, lane] = dz
+        lift[b, 0, lane] = lx
+        lift[b, 1, lane] = ly
+        lift[b, 2, lane] = lz
+        side[b, 0, lane] = 0.0
+        side[b, 1, lane] = 0.0
+        side[b, 2, lane] = 0.0
+        total[b, 0, lane] = tx
+        total[b, 1, lane] = ty
+        total[b, 2, lane] = tz
+        cd[i] = c_d
+        cl[i] = c_l
+        reynolds[i] = re
+        mach[i] = ma
+        times[i] = t
+        taken += 1
+    return taken, t
 
 @dataclass
 class SimulationParameters:
@@ -22,32 +151,304 @@ class SimulationParameters:
     enable_turbulence: bool = False
     turbulence_intensity: float = 0.1
 
+# Derived geometry per object type: (frontal area, surface area, volume)
+
+def _jet_geometry(length: float, width: float, height: float) -> Tuple[float, float, float]:
+    frontal_area = np.pi * (width/2) * (height/2)  # Elliptical cross-section
+    surface_area = 2 * np.pi * (width/2) * length  # Simplified
+    volume = frontal_area * length * 0.7  # Approximate
+    return frontal_area, surface_area, volume
+
+def _sphere_geometry(length: float, width: float, height: float) -> Tuple[float, float, float]:
+    radius = width / 2
+    frontal_area = np.pi * radius**2
+    surface_area = 4 * np.pi * radius**2
+    volume = (4/3) * np.pi * radius**3
+    return frontal_area, surface_area, volume
+
+def _cylinder_geometry(length: float, width: float, height: float) -> Tuple[float, float, float]:
+    radius = width / 2
+    frontal_area = np.pi * radius**2
+    surface_area = 2 * np.pi * radius * (radius + length)
+    volume = np.pi * radius**2 * length
+    return frontal_area, surface_area, volume
+
+def _box_geometry(length: float, width: float, height: float) -> Tuple[float, float, float]:
+    frontal_area = width * height
+    surface_area = 2 * (width * height + width * length + height * length)
+    volume = width * height * length
+    return frontal_area, surface_area, volume
+
+_GEOMETRY_FUNCS = {
+    ObjectType.JET: _jet_geometry,
+    ObjectType.SPHERE: _sphere_geometry,
+    ObjectType.CYLINDER: _cylinder_geometry,
+    ObjectType.CUBE: _box_geometry,
+}
+
+class AoSoA:
+    """Buffer of 3-vector rows stored as blocks of BLOCK rows, shape (blocks, 3, BLOCK)
+    
+    Each component of a block is contiguous, so reductions over rows run
+    along BLOCK-wide lanes. Rows read and write like an (n, 3) array of the
+    first size rows; the owner sets size as rows are recorded, and may write
+    any row within the capacity.
+    """
+    
+    def __init__(self, capacity: int, dtype=np.float64):
+        self.data = np.zeros((-(-capacity // BLOCK), 3, BLOCK), dtype=dtype)
+        self.size = 0
+    
+    def __len__(self) -> int:
+        return self.size
+    
+    @property
+    def capacity(self) -> int:
+        return len(self.data) * BLOCK
+    
+    def _index(self, index: int, limit: int) -> int:
+        """Resolve a negative index against size and bounds-check it"""
+        if index < 0:
+            index += self.size
+        if not 0 <= index < limit:
+            raise IndexError("AoSoA index out of range")
+        return index
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step == 1:
+                return self.rows(start, stop)
+            return self.rows(0, len(self))[index]
+        index = self._index(index, self.size)
+        return self.data[index // BLOCK, :, index % BLOCK]
+    
+    def __setitem__(self, index: int, value):
+        index = self._index(index, self.capacity)
+        self.data[index // BLOCK, :, index % BLOCK] = value
+    
+    def resize(self, capacity: int):
+        """Grow to hold at least capacity rows, keeping the existing rows"""
+        self.data = np.resize(self.data, (-(-capacity // BLOCK), 3, BLOCK))
+    
+    def rows(self, start: int, stop: int) -> np.ndarray:
+        """Copy of rows start..stop as an (n, 3) array"""
+        if stop <= start:
+            return np.empty((0, 3), dtype=self.data.dtype)
+        first, last = start // BLOCK, -(-stop // BLOCK)
+        blocks = self.data[first:last].transpose(0, 2, 1).reshape(-1, 3)
+        return blocks[start - first * BLOCK:stop - first * BLOCK]
+    
+    def norms(self, start: int, stop: int) -> np.ndarray:
+        """Euclidean norms of rows start..stop"""
+        if stop <= start:
+            return np.empty(0, dtype=self.data.dtype)
+        first, last = start // BLOCK, -(-stop // BLOCK)
+        blocks = self.data[first:last]
+        squares = blocks[:, 0] * blocks[:, 0]
+        squares += blocks[:, 1] * blocks[:, 1]
+        squares += blocks[:, 2] * blocks[:, 2]
+        return np.sqrt(squares, out=squares).ravel()[start - first * BLOCK:stop - first * BLOCK]
+
+class ForceHistory(Sequence):
+    """List-like view of the recorded forces that builds per-step dicts on access"""
+    
+    def __init__(self, results: 'SimulationResults'):
+        self._results = results
+    
+    def __len__(self) -> int:
+        return self._results.n
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._results.force_row(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("force history index out of range")
+        return self._results.force_row(index)
+
 @dataclass
 class SimulationResults:
     """Container for simulation results"""
-    time_history: List[float] = field(default_factory=list)
-    position_history: List[np.ndarray] = field(default_factory=list)
-    velocity_history: List[np.ndarray] = field(default_factory=list)
-    acceleration_history: List[np.ndarray] = field(default_factory=list)
-    force_history: List[Dict] = field(default_factory=list)
+    capacity: int = 1024  # Initial rows of the history buffers; they grow as needed
     flow_fields: List[Dict] = field(default_factory=list)
     efficiency_metrics: List[Dict] = field(default_factory=list)
     
+    # Per-step histories, kept as preallocated arrays filled up to n. The
+    # kinematic buffers have an extra leading row for the initial state, so
+    # their row n is always the current state.
+    _KINEMATIC_BUFFERS = ('_positions', '_velocities', '_accelerations')
+    _FORCE_BUFFERS = ('drag_forces', 'lift_forces', 'side_forces', 'total_forces')
+    _SCALAR_BUFFERS = ('cd', 'cl', 'reynolds', 'mach')
+    
+    def __post_init__(self):
+        self.times = np.empty(self.capacity)  # Double precision, like the clock
+        self._positions = np.zeros((self.capacity + 1, 3))
+        self._velocities = np.zeros((self.capacity + 1, 3))
+        self._accelerations = np.zeros((self.capacity + 1, 3), dtype=HISTORY_DTYPE)
+        for name in self._FORCE_BUFFERS:
+            setattr(self, name, AoSoA(self.capacity, HISTORY_DTYPE))
+        for name in self._SCALAR_BUFFERS:
+            setattr(self, name, np.empty(self.capacity, dtype=HISTORY_DTYPE))
+        self.n = 0
+    
+    @property
+    def n(self) -> int:
+        """Number of recorded steps"""
+        return self._n
+    
+    @n.setter
+    def n(self, value: int):
+        self._n = value
+        for name in self._FORCE_BUFFERS:
+            getattr(self, name).size = value
+    
+    @property
+    def time_history(self) -> np.ndarray:
+        """Times recorded so far, shape (n,)"""
+        return self.times[:self.n]
+    
+    @property
+    def positions(self) -> np.ndarray:
+        """Position buffer, row i holding step i like the force buffers"""
+        return self._positions[1:]
+    
+    @property
+    def velocities(self) -> np.ndarray:
+        """Velocity buffer, row i holding step i like the force buffers"""
+        return self._velocities[1:]
+    
+    @property
+    def accelerations(self) -> np.ndarray:
+        """Acceleration buffer, row i holding step i like the force buffers"""
+        return self._accelerations[1:]
+        
+    @property
+    def position_history(self) -> np.ndarray:
+        """Positions recorded so far, shape (n, 3)"""
+        return self._positions[1:self.n + 1]
+    
+    @property
+    def velocity_history(self) -> np.ndarray:
+        """Velocities recorded so far, shape (n, 3)"""
+        return self._velocities[1:self.n + 1]
+    
+    @property
+    def acceleration_history(self) -> np.ndarray:
+        """Accelerations recorded so far, shape (n, 3)"""
+        return self._accelerations[1:self.n + 1]
+    
+    @property
+    def force_history(self) -> ForceHistory:
+        """Forces recorded so far, as a sequence of force dicts"""
+        return ForceHistory(self)
+    
+    def force_result(self, i: int) -> ForceResult:
+        """Forces and coefficients of step i"""
+        return ForceResult(self.drag_forces[i], self.lift_forces[i], self.side_forces[i],
+                           self.total_forces[i], self.cd[i], self.cl[i],
+                           self.reynolds[i], self.mach[i])
+    
+    def force_row(self, i: int) -> Dict:
+        """Rebuild the force dict of step i"""
+        return self.force_result(i).to_dict()
+    
+    def reserve(self, size: int):
+        """Grow the history buffers to hold at least size rows"""
+        capacity = len(self.cd)
+        if size <= capacity:
+            return
+        capacity = max(2 * capacity, size)
+        self.times = np.resize(self.times, capacity)
+        for name in self._KINEMATIC_BUFFERS:
+            setattr(self, name, np.resize(getattr(self, name), (capacity + 1, 3)))
+        for name in self._FORCE_BUFFERS:
+            getattr(self, name).resize(capacity)
+        for name in self._SCALAR_BUFFERS:
+            buffer = getattr(self, name)
+            setattr(self, name, np.resize(buffer, (capacity,) + buffer.shape[1:]))
+    
+    def append(self, time: float, position: np.ndarray, velocity: np.ndarray,
+               acceleration: np.ndarray, forces):
+        """Record one time step; forces is a ForceResult or a legacy force dict"""
+        n = self.n
+        if n == len(self.cd):
+            self.reserve(n + 1)
+            
+        self._positions[n + 1] = position
+        self._velocities[n + 1] = velocity
+        self._accelerations[n + 1] = acceleration
+        if isinstance(forces, dict):
+            forces = ForceResult.from_dict(forces)
+        self.commit_step(time, forces)
+    
+    def commit_step(self, time: float, forces: ForceResult):
+        """Record the time and forces of a step whose kinematics are already in row n + 1"""
+        n = self.n
+        self.drag_forces[n] = forces.drag
+        self.lift_forces[n] = forces.lift
+        self.side_forces[n] = forces.side_force
+        self.total_forces[n] = forces.total
+        self.cd[n] = forces.cd
+        self.cl[n] = forces.cl
+        self.reynolds[n] = forces.reynolds
+        self.mach[n] = forces.mach
+        
+        self.times[n] = time
+        self.n = n + 1
+    
     def get_latest_data(self) -> Dict:
         """Get the most recent simulation data"""
-        if not self.time_history:
+        if self.n == 0:
             return {}
         
         return {
-            'time': self.time_history[-1],
-            'position': self.position_history[-1],
-            'velocity': self.velocity_history[-1],
-            'acceleration': self.acceleration_history[-1],
-            'forces': self.force_history[-1],
+            'time': self.times[self.n - 1],
+            'position': self.positions[self.n - 1],
+            'velocity': self.velocities[self.n - 1],
+            'acceleration': self.accelerations[self.n - 1],
+            'forces': self.force_row(self.n - 1),
             'flow_field': self.flow_fields[-1] if self.flow_fields else None,
             'efficiency': self.efficiency_metrics[-1] if self.efficiency_metrics else None
         }
 
+class BufferedState(SimulationState):
+    """Simulation state whose kinematics live in the current row of a results buffer
+    
+    position, velocity and acceleration are views that the next step
+    supersedes; assigning to them writes into the buffer. Copy them to keep
+    a value across steps.
+    """
+    
+    def __init__(self, results: SimulationResults, **fields):
+        self.results = results
+        super().__init__(**fields)
+    
+    @property
+    def position(self) -> np.ndarray:
+        return self.results._positions[self.results.n]
+    
+    @position.setter
+    def position(self, value):
+        self.results._positions[self.results.n] = value
+    
+    @property
+    def velocity(self) -> np.ndarray:
+        return self.results._velocities[self.results.n]
+    
+    @velocity.setter
+    def velocity(self, value):
+        self.results._velocities[self.results.n] = value
+    
+    @property
+    def acceleration(self) -> np.ndarray:
+        return self.results._accelerations[self.results.n]
+    
+    @acceleration.setter
+    def acceleration(self, value):
+        self.results._accelerations[self.results.n] = value
+
 class SimulationManager:
     """Manages the aerodynamic simulation"""
     
@@ -55,10 +456,13 @@ class SimulationManager:
         self.engine = AerodynamicsEngine()
         self.is_running = False
         self.is_paused = False
+        self._resume_event = threading.Event()  # Cleared while paused
+        self._resume_event.set()
         self.current_time = 0.0
         self.results = SimulationResults()
         self.parameters = SimulationParameters()
-        self.state = SimulationState(
+        self.state = BufferedState(
+            self.results,
             position=np.array([0.0, 0.0, 0.0]),
             velocity=np.array([0.0, 0.0, 0.0]),
             acceleration=np.array([0.0, 0.0, 0.0]),
@@ -69,33 +473,25 @@ class SimulationManager:
         )
         self.geometry = None
         self.callbacks = []
+        self._wind_vec = None  # Wind vector for the current parameters
+        self._turb_block = np.empty((0, 3))  # Pre-drawn standard normal samples
+        self._turb_pos = 0
+        
+    def set_object_geometry(self, obj_type: ObjectType, length: float, width: float, height: float,
+                            mesh=None):
+        """Set the object geometry for simulation
         
-    def set_object_geometry(self, obj_type: ObjectType, length: float, width: float, height: float):
-        """Set the object geometry for simulation"""
+        A mesh, if given, supplies the frontal area, surface area and volume.
+        """
         # Calculate derived properties
-        if obj_type == ObjectType.JET:
-            frontal_area = np.pi * (width/2) * (height/2)  # Elliptical cross-section
-            surface_area = 2 * np.pi * (width/2) * length  # Simplified
-            volume = frontal_area * length * 0.7  # Approximate
-        elif obj_type == ObjectType.SPHERE:
-            radius = width / 2
-            frontal_area = np.pi * radius**2
-            surface_area = 4 * np.pi * radius**2
-            volume = (4/3) * np.pi * radius**3
-        elif obj_type == ObjectType.CYLINDER:
-            radius = width / 2
-            frontal_area = np.pi * radius**2
-            surface_area = 2 * np.pi * radius * (radius + length)
-            volume = np.pi * radius**2 * length
-        elif obj_type == ObjectType.CUBE:
-            frontal_area = width * height
-            surface_area = 2 * (width * height + width * length + height * length)
-            volume = width * height * length
+        if mesh is not None:
+            frontal_area = mesh.get_frontal_area()
+            surface_area = mesh.get_surface_area()
+            volume = mesh.get_volume()
         else:
-            frontal_area = width * height
-            surface_area = 2 * (width * height + width * length + height * length)
-            volume = width * height * length
-            
+            geometry_func = _GEOMETRY_FUNCS.get(obj_type, _box_geometry)
+            frontal_area, surface_area, volume = geometry_func(length, width, height)
+        
         self.geometry = ObjectGeometry(
             length=length,
             width=width,
@@ -103,7 +499,8 @@ class SimulationManager:
             frontal_area=frontal_area,
             surface_area=surface_area,
             volume=volume,
-            object_type=obj_type
+            object_type=obj_type,
+            mesh=mesh
         )
     
     def set_parameters(self, **kwargs):
@@ -111,6 +508,7 @@ class SimulationManager:
         for key, value in kwargs.items():
             if hasattr(self.parameters, key):
                 setattr(self.parameters, key, value)
+        self._wind_vec = None
     
     def add_callback(self, callback: Callable):
         """Add a callback function to be called during simulation"""
@@ -121,8 +519,13 @@ class SimulationManager:
         self.current_time = 0.0
         self.is_running = False
         self.is_paused = False
-        self.results = SimulationResults()
-        self.state = SimulationState(
+        self._resume_event.set()
+        self._wind_vec = None
+        self._turb_block = np.empty((0, 3))
+        self._turb_pos = 0
+        self.results = SimulationResults(capacity=self._expected_steps())
+        self.state = BufferedState(
+            self.results,
             position=np.array([0.0, 0.0, 0.0]),
             velocity=self.parameters.wind_velocity.copy(),  # Start with wind velocity
             acceleration=np.array([0.0, 0.0, 0.0]),
@@ -132,24 +535,55 @@ class SimulationManager:
             moments={}
         )
     
+    def _expected_steps(self) -> int:
+        """Number of steps a full run takes, capped to bound preallocation"""
+        steps = int(self.parameters.max_time / self.parameters.dt) + 1
+        return min(steps, MAX_PREALLOCATED_STEPS)
+    
+    def _get_wind_velocity(self) -> np.ndarray:
+        """Wind velocity with angle, rebuilt only when the parameters change"""
+        if self._wind_vec is None:
+            wind_angle_rad = np.radians(self.parameters.wind_angle)
+            self._wind_speed = np.linalg.norm(self.parameters.wind_velocity)
+            self._wind_vec = np.array([
+                self._wind_speed * np.cos(wind_angle_rad),
+                self._wind_speed * np.sin(wind_angle_rad),
+                0.0
+            ])
+        return self._wind_vec
+    
+    def _turbulence_samples(self, count: int) -> np.ndarray:
+        """Next count standard normal turbulence samples, drawn in blocks
+        
+        The samples are not consumed; advance _turb_pos past those used.
+        """
+        available = len(self._turb_block) - self._turb_pos
+        if available < count:
+            blocks = -(-(count - available) // TURBULENCE_BLOCK_STEPS)
+            self._turb_block = np.concatenate((
+                self._turb_block[self._turb_pos:],
+                np.random.standard_normal((blocks * TURBULENCE_BLOCK_STEPS, 3))
+            ))
+            self._turb_pos = 0
+        return self._turb_block[self._turb_pos:self._turb_pos + count]
+    
+    def _next_turbulence(self) -> np.ndarray:
+        """Next standard normal turbulence sample"""
+        sample = self._turbulence_samples(1)[0]
+        self._turb_pos += 1
+        return sample
+    
     def step_simulation(self) -> bool:
         """Perform one simulation time step"""
         if not self.geometry or self.current_time >= self.parameters.max_time:
             return False
         
-        # Calculate wind velocity with angle
-        wind_angle_rad = np.radians(self.parameters.wind_angle)
-        wind_speed = np.linalg.norm(self.parameters.wind_velocity)
-        wind_velocity = np.array([
-            wind_speed * np.cos(wind_angle_rad),
-            wind_speed * np.sin(wind_angle_rad),
-            0.0
-        ])
+        wind_velocity = self._get_wind_velocity()
         
         # Add turbulence if enabled
         if self.parameters.enable_turbulence:
-            turbulence = np.random.normal(0, self.parameters.turbulence_intensity, 3)
-            wind_velocity += turbulence * wind_speed
+            turbulence = self._next_turbulence() * self.parameters.turbulence_intensity
+            wind_velocity = wind_velocity + turbulence * self._wind_speed
         
         # Calculate aerodynamic forces
         forces = self.engine.calculate_forces(
@@ -159,29 +593,34 @@ class SimulationManager:
             wind_velocity
         )
         
+        # Euler integration from the current state row n into row n + 1
+        results = self.results
+        n = results.n
+        results.reserve(n + 1)
+        dt = self.parameters.dt
+        positions, velocities = results._positions, results._velocities
+        
         # Calculate total acceleration (including gravity)
-        # Assume unit mass for simplicity
-        total_force = forces['total'] + self.parameters.gravity
-        self.state.acceleration = total_force
+        # Assume unit mass for simplicity; integrate with the double precision value
+        acceleration = forces.total + self.parameters.gravity
+        results._accelerations[n + 1] = acceleration
         
-        # Update velocity and position using Euler integration
-        self.state.velocity += self.state.acceleration * self.parameters.dt
-        self.state.position += self.state.velocity * self.parameters.dt
+        # Update velocity and position
+        np.multiply(acceleration, dt, out=velocities[n + 1])
+        velocities[n + 1] += velocities[n]
+        np.multiply(velocities[n + 1], dt, out=positions[n + 1])
+        positions[n + 1] += positions[n]
         
         # Update time
-        self.current_time += self.parameters.dt
+        self.current_time += dt
         self.state.time = self.current_time
         self.state.forces = forces
         
-        # Store results
-        self.results.time_history.append(self.current_time)
-        self.results.position_history.append(self.state.position.copy())
-        self.results.velocity_history.append(self.state.velocity.copy())
-        self.results.acceleration_history.append(self.state.acceleration.copy())
-        self.results.force_history.append(forces.copy())
+        # Store results; row n + 1 becomes the current state
+        results.commit_step(self.current_time, forces)
         
         # Calculate flow field (every 10 steps to save computation)
-        if len(self.results.time_history) % 10 == 0:
+        if self.results.n % FLOW_FIELD_INTERVAL == 0:
             flow_field = self.engine.generate_flow_field(
                 self.geometry,
                 self.state.velocity,
@@ -203,25 +642,123 @@ class SimulationManager:
         
         return True
     
-    def run_simulation(self, steps: Optional[int] = None):
-        """Run the simulation for specified steps or until completion"""
+    def _advance_steps(self, steps: int) -> int:
+        """Integrate up to steps time steps in one compiled chunk
+        
+        Produces the same histories and flow fields as repeated step_simulation
+        calls, but does not invoke callbacks. Returns the number of steps taken.
+        """
+        params = self.parameters
+        
+        # Size the buffers for the steps that fit before max_time, not the request
+        steps = min(steps, int(np.ceil((params.max_time - self.current_time) / params.dt)) + 1)
+        if not self.geometry or steps <= 0:
+            return 0
+        
+        results = self.results
+        air = self.engine.air_props
+        n_start = results.n
+        results.reserve(n_start + steps)
+        
+        wind_velocity = self._get_wind_velocity()
+        if params.enable_turbulence:
+            turbulence = self._turbulence_samples(steps)
+        else:
+            turbulence = np.empty((0, 3))
+        cd_model, cd_base, cl_value = self.engine.angle_coefficients(
+            self.geometry.object_type, params.object_angle)
+        
+        taken, self.current_time = _advance_chunk(
+            results._positions, results._velocities, results._accelerations,
+            results.drag_forces.data, results.lift_forces.data,
+            results.side_forces.data, results.total_forces.data,
+            results.cd, results.cl, results.reynolds, results.mach, results.times,
+            n_start, steps, self.current_time, params.dt, params.max_time,
+            params.gravity, wind_velocity, turbulence,
+            params.turbulence_intensity, self._wind_speed,
+            air.density, air.viscosity, air.speed_of_sound,
+            self.geometry.frontal_area, self.geometry.length, cd_model, cd_base, cl_value
+        )
+        if params.enable_turbulence:
+            self._turb_pos += taken
+        if taken == 0:
+            return 0
+        
+        results.n = n_start + taken
+        self.state.time = self.current_time
+        self.state.forces = results.force_result(results.n - 1)
+        
+        # Flow fields for the steps that fall on the recording interval
+        first = -(-(n_start + 1) // FLOW_FIELD_INTERVAL) * FLOW_FIELD_INTERVAL
+        for count in range(first, results.n + 1, FLOW_FIELD_INTERVAL):
+            flow_field = self.engine.generate_flow_field(
+                self.geometry,
+                results.velocities[count - 1],
+                params.object_angle,
+                (20.0, 10.0)  # Domain size
+            )
+            results.flow_fields.append(flow_field)
+            efficiency = self.engine.calculate_aerodynamic_efficiency(
+                results.force_result(count - 1), self.geometry)
+            results.efficiency_metrics.append(efficiency)
+        
+        return taken
+    
+    def run_n_steps(self, n: int) -> int:
+        """Advance n time steps in one call, stopping early at max_time
+        
+        Returns the number of steps taken. Without callbacks this is a single
+        compiled integration chunk.
+        """
+        if self.callbacks:
+            taken = 0
+            while taken < n and self.step_simulation():
+                taken += 1
+            return taken
+        return self._advance_steps(n)
+    
+    def run_simulation(self, steps: Optional[int] = None, interactive: bool = False):
+        """Run the simulation for specified steps or until completion
+        
+        Without callbacks, steps are integrated in compiled chunks; callbacks
+        force one step at a time. Interactive runs also process pending Qt
+        events every INTERACTIVE_EVENT_STEPS steps.
+        """
         if not self.geometry:
             raise ValueError("Object geometry must be set before running simulation")
         
+        if interactive:
+            from PySide6.QtCore import QCoreApplication
+            process_events = QCoreApplication.processEvents
+        
         self.is_running = True
         step_count = 0
         max_steps = steps if steps else int(self.parameters.max_time / self.parameters.dt)
+        chunk_steps = INTERACTIVE_EVENT_STEPS if interactive else BATCH_CHUNK_STEPS
         
         while step_count < max_steps:
             if not self.is_running:
                 break  # Exit immediately if stop_simulation() was called
 
-            if not self.is_paused:
-                if not self.step_simulation():
-                    break
-                step_count += 1
-
-            time.sleep(0.001)  # Small sleep to prevent CPU overuse
+            if self.is_paused:
+                # Block until resumed or stopped rather than spinning
+                self._resume_event.wait(0.05)
+                if interactive:
+                    process_events()
+                continue
+                
+            if self.callbacks:
+                # Callbacks observe every step
+                chunk, taken = 1, int(self.step_simulation())
+            else:
+                chunk = min(max_steps - step_count, chunk_steps)
+                taken = self._advance_steps(chunk)
+            step_count += taken
+            if taken < chunk:
+                break
+            
+            if interactive and step_count % INTERACTIVE_EVENT_STEPS == 0:
+                process_events()
         
         self.is_running = False
 
@@ -229,15 +766,18 @@ class SimulationManager:
     def pause_simulation(self):
         """Pause the simulation"""
         self.is_paused = True
+        self._resume_event.clear()
     
     def resume_simulation(self):
         """Resume the simulation"""
         self.is_paused = False
+        self._resume_event.set()
     
     def stop_simulation(self):
         """Stop the simulation"""
         self.is_running = False
         self.is_paused = False
+        self._resume_event.set()
     
     def get_current_data(self) -> Dict:
         """Get current simulation data"""
@@ -252,33 +792,34 @@ class SimulationManager:
     
     def get_analysis_data(self) -> Dict:
         """Get comprehensive analysis data"""
-        if not self.results.time_history:
+        if self.results.n == 0:
             return {}
         
         # Calculate statistics
-        velocities = np.array(self.results.velocity_history)
-        speeds = np.linalg.norm(velocities, axis=1)
+        positions = self.results.position_history
+        speeds = np.linalg.norm(self.results.velocity_history, axis=1)
         
         # Energy analysis
         kinetic_energy = 0.5 * speeds**2  # Assuming unit mass
-        potential_energy = -self.parameters.gravity[1] * np.array([pos[1] for pos in self.results.position_history])
+        potential_energy = -self.parameters.gravity[1] * positions[:, 1]
         total_energy = kinetic_energy + potential_energy
         
         # Force analysis
-        drag_forces = [np.linalg.norm(f.get('drag', [0, 0, 0])) for f in self.results.force_history]
-        lift_forces = [np.linalg.norm(f.get('lift', [0, 0, 0])) for f in self.results.force_history]
+        n = self.results.n
+        drag_forces = self.results.drag_forces.norms(0, n)
+        lift_forces = self.results.lift_forces.norms(0, n)
         
         return {
             'time_stats': {
                 'total_time': self.current_time,
-                'time_steps': len(self.results.time_history),
+                'time_steps': self.results.n,
                 'dt': self.parameters.dt
             },
             'motion_stats': {
                 'max_speed': np.max(speeds) if len(speeds) > 0 else 0,
                 'avg_speed': np.mean(speeds) if len(speeds) > 0 else 0,
                 'final_speed': speeds[-1] if len(speeds) > 0 else 0,
-                'max_position': np.max(np.abs(self.results.position_history), axis=0) if self.results.position_history else [0, 0, 0]
+                'max_position': np.max(np.abs(positions), axis=0) if len(positions) > 0 else [0, 0, 0]
             },
             'energy_stats': {
                 'initial_ke': kinetic_energy[0] if len(kinetic_energy) > 0 else 0,
@@ -286,10 +827,10 @@ class SimulationManager:
                 'energy_loss': total_energy[0] - total_energy[-1] if len(total_energy) > 1 else 0
             },
             'force_stats': {
-                'max_drag': np.max(drag_forces) if drag_forces else 0,
-                'avg_drag': np.mean(drag_forces) if drag_forces else 0,
-                'max_lift': np.max(lift_forces) if lift_forces else 0,
-                'avg_lift': np.mean(lift_forces) if lift_forces else 0
+                'max_drag': np.max(drag_forces) if n > 0 else 0,
+                'avg_drag': np.mean(drag_forces) if n > 0 else 0,
+                'max_lift': np.max(lift_forces) if n > 0 else 0,
+                'avg_lift': np.mean(lift_forces) if n > 0 else 0
             },
             'efficiency_stats': self.results.efficiency_metrics[-1] if self.results.efficiency_metrics else {}
         }
\ No newline at end of file
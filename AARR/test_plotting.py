@@ -8,13 +8,40 @@ import os
 sys.path.append('src')
 
 import numpy as np
+import pyqtgraph as pg
 from PySide6.QtWidgets import QApplication
 from src.gui.visualization import DataPlotWidget
 from src.physics.simulation import SimulationManager, SimulationResults, ObjectType
 
+def test_trajectory_reset():
+    """Test that a reset simulation leaves no stale trajectory markers"""
+    app = QApplication.instance() or QApplication(sys.argv)
+    
+    plot_widget = DataPlotWidget()
+    plot_widget.plot_combo.setCurrentText("Trajectory (2D)")
+    
+    sim = SimulationManager()
+    sim.set_object_geometry(ObjectType.SPHERE, length=2.0, width=2.0, height=2.0)
+    sim.run_n_steps(100)
+    plot_widget.update_data(sim.results)
+    
+    # One step after a reset is too short for an end marker or arrows
+    sim.reset_simulation()
+    sim.run_n_steps(1)
+    plot_widget.update_data(sim.results)
+    app.processEvents()
+    
+    plot = plot_widget.plot_widget
+    end_markers = [item for item in plot.listDataItems() if item.name() == 'End']
+    arrows = [item for item in plot.getPlotItem().items
+              if isinstance(item, pg.ArrowItem) and item.isVisible()]
+    assert not end_markers, "stale end marker after reset"
+    assert not arrows, f"{len(arrows)} stale arrows after reset"
+    print("✓ Trajectory plot cleared on reset")
+
 def test_plotting():
     """Test the plotting functionality"""
-    app = QApplication(sys.argv)
+    app = QApplication.instance() or QApplication(sys.argv)
     
     # Create a plot widget
     plot_widget = DataPlotWidget()
@@ -27,22 +54,20 @@ def test_plotting():
     # Generate test data
     times = np.linspace(0, 5, 100)
     for t in times:
-        results.time_history.append(t)
-        
         # Position: parabolic trajectory
         x = 10 * t
         y = 5 * t - 0.5 * 9.81 * t**2
         z = 0
-        results.position_history.append(np.array([x, y, z]))
+        position = np.array([x, y, z])
         
         # Velocity: derivative of position
         vx = 10
         vy = 5 - 9.81 * t
         vz = 0
-        results.velocity_history.append(np.array([vx, vy, vz]))
+        velocity = np.array([vx, vy, vz])
         
         # Acceleration: constant gravity
-        results.acceleration_history.append(np.array([0, -9.81, 0]))
+        acceleration = np.array([0, -9.81, 0])
         
         # Forces: drag and gravity
         speed = np.sqrt(vx**2 + vy**2)
@@ -61,7 +86,7 @@ def test_plotting():
                 'reynolds': 10000 + t * 1000
             }
         }
-        results.force_history.append(forces)
+        results.append(t, position, velocity, acceleration, forces)
     
     # Update the plot widget with test data
     plot_widget.update_data(results)
@@ -81,4 +106,5 @@ def test_plotting():
     return app.exec()
 
 if __name__ == "__main__":
+    test_trajectory_reset()
     test_plotting()
\ No newline at end of file